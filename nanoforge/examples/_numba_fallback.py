@@ -0,0 +1,63 @@
+"""
+Fallback array kernels for when the NanoForge Rust extension isn't built
+
+Same signatures as nanoforge.vec_add / vec_sum / vec_scale. With Numba
+installed they are LLVM-compiled, auto-vectorized and split across cores
+with prange (the first call pays the JIT compile); without it they fall
+back to NumPy ufuncs, so the demos still run, just slower.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+
+if HAVE_NUMBA:
+
+    @njit(parallel=True, fastmath=True, boundscheck=False, cache=True)
+    def vec_add(a, b, c):
+        """c[i] = a[i] + b[i] (Numba, parallel)"""
+        if a.shape[0] != b.shape[0] or a.shape[0] != c.shape[0]:
+            raise ValueError("Array size mismatch")
+        for i in prange(a.shape[0]):
+            c[i] = a[i] + b[i]
+
+    @njit(parallel=True, fastmath=True, boundscheck=False, cache=True)
+    def vec_sum(arr):
+        """Sum of all elements as int64 (Numba, parallel reduction)"""
+        total = 0
+        for i in prange(arr.shape[0]):
+            total += arr[i]
+        return total
+
+    @njit(parallel=True, fastmath=True, boundscheck=False, cache=True)
+    def vec_scale(arr, scalar):
+        """arr[i] *= scalar, in place (Numba, parallel)"""
+        for i in prange(arr.shape[0]):
+            arr[i] *= scalar
+
+else:
+
+    def vec_add(a, b, c):
+        """c[i] = a[i] + b[i] (NumPy)"""
+        if a.shape[0] != b.shape[0] or a.shape[0] != c.shape[0]:
+            raise ValueError("Array size mismatch")
+        np.add(a, b, out=c)
+
+    def vec_sum(arr):
+        """Sum of all elements as int64 (NumPy)"""
+        return int(arr.sum(dtype=np.int64))
+
+    def vec_scale(arr, scalar):
+        """arr[i] *= scalar, in place (NumPy)"""
+        np.multiply(arr, scalar, out=arr)
+
+
+def backend():
+    """Name of the implementation in use ("numba" or "numpy")"""
+    return "numba" if HAVE_NUMBA else "numpy"
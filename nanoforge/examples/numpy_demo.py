@@ -7,10 +7,18 @@ Build the Python module first:
     maturin develop --features python
 
 Then run this script:
-    python3 examples/numpy_demo.py
+    python3 examples/numpy_demo.py [--core N] [--mlock]
 """
 
+import argparse
+import ctypes
+import os
+from concurrent.futures import ThreadPoolExecutor
+import shutil
 import sys
+import tempfile
+import time
+import timeit
 
 try:
     import numpy as np
@@ -33,21 +41,253 @@ def format_ns(ns):
         return f"{ns:.0f} ns"
 
 
-def is_aligned(arr, alignment=32):
+def bench_ns(stmt, namespace):
+    """Time a statement with timeit, returning (thread CPU ns, wall ns) per call
+
+    The loop is timed with time.thread_time, so slices where the thread was
+    descheduled aren't billed to the kernel; averaging over more loops would
+    only make that bias consistent, not remove it. A second run of the same
+    loop count on perf_counter gives the wall figure to compare against.
+    """
+    timer = timeit.Timer(stmt, timer=time.thread_time, globals=namespace)
+    # Warmup
+    timer.timeit(3)
+    number, cpu_seconds = timer.autorange()
+    wall_seconds = timeit.Timer(stmt, globals=namespace).timeit(number)
+    return cpu_seconds * 1e9 / number, wall_seconds * 1e9 / number
+
+
+def time_once_ns(fn, *args, **kwargs):
+    """Run fn once, returning (thread CPU ns, wall-clock ns)
+
+    thread_time_ns reads CLOCK_THREAD_CPUTIME_ID on Linux: only time this
+    thread spent on a CPU (user + kernel, so page faults count). Wall time
+    well above it means the thread was descheduled or stalled off-CPU.
+    """
+    start_cpu = time.thread_time_ns()
+    start_wall = time.perf_counter_ns()
+    fn(*args, **kwargs)
+    wall_ns = time.perf_counter_ns() - start_wall
+    cpu_ns = time.thread_time_ns() - start_cpu
+    return cpu_ns, wall_ns
+
+
+def cpu_wall_str(cpu_ns, wall_ns):
+    """Format a (CPU, wall) pair, flagging scheduler interference"""
+    text = f"{format_ns(cpu_ns):>10} CPU  {format_ns(wall_ns):>10} wall"
+    if wall_ns > 1.2 * cpu_ns:
+        text += "  ⚠️ wall >> CPU: descheduled or waiting"
+    return text
+
+
+def parse_cpu_list(text):
+    """Parse a sysfs CPU list such as "0-7,16" into a set of ints"""
+    cpus = set()
+    for part in text.strip().split(","):
+        if "-" in part:
+            lo, hi = part.split("-")
+            cpus.update(range(int(lo), int(hi) + 1))
+        elif part:
+            cpus.add(int(part))
+    return cpus
+
+
+def max_freq_khz(core):
+    """cpuinfo_max_freq of a core in kHz, or 0 if not exposed"""
+    path = f"/sys/devices/system/cpu/cpu{core}/cpufreq/cpuinfo_max_freq"
+    try:
+        with open(path) as f:
+            return int(f.read())
+    except (OSError, ValueError):
+        return 0
+
+
+def default_core():
+    """Pick a performance core we are allowed to run on
+
+    On hybrid Intel parts the highest-numbered CPUs are E-cores, so prefer
+    the P-cores listed in /sys/devices/cpu_core/cpus, then the CPU with the
+    highest cpuinfo_max_freq. Ties go to the last CPU (core 0 takes most
+    IRQs).
+    """
+    if not hasattr(os, "sched_getaffinity"):
+        return 0
+    allowed = os.sched_getaffinity(0)
+    try:
+        with open("/sys/devices/cpu_core/cpus") as f:
+            p_cores = parse_cpu_list(f.read()) & allowed
+    except (OSError, ValueError):
+        p_cores = set()
+    candidates = p_cores or allowed
+    return max(candidates, key=lambda cpu: (max_freq_khz(cpu), cpu))
+
+
+def pin_to_core(core):
+    """Pin this process to a single core so timings aren't hit by migration"""
+    if hasattr(os, "sched_setaffinity"):
+        allowed = os.sched_getaffinity(0)
+        if core not in allowed:
+            print(f"   ⚠️ Core {core} is not in the allowed set {sorted(allowed)}")
+            return False
+        try:
+            os.sched_setaffinity(0, {core})
+        except OSError as e:
+            print(f"   ⚠️ Could not pin to core {core}: {e}")
+            return False
+        return True
+    # macOS / Windows: fall back to psutil when it is installed
+    try:
+        import psutil
+    except ImportError:
+        return False
+    try:
+        psutil.Process().cpu_affinity([core])
+    except (AttributeError, ValueError, psutil.Error):
+        # cpu_affinity() does not exist on macOS
+        return False
+    return True
+
+
+def core_freq_mhz(core):
+    """Current scaling frequency of a core in MHz, or None if not exposed"""
+    path = f"/sys/devices/system/cpu/cpu{core}/cpufreq/scaling_cur_freq"
+    try:
+        with open(path) as f:
+            return int(f.read()) / 1000
+    except (OSError, ValueError):
+        return None
+
+
+def fill_arange(out, step=1, chunk=1 << 20):
+    """Write arange(len(out)) * step into out in cache-sized chunks
+
+    Avoids materializing a full-size arange (and a second full-size
+    product) just to copy it into an existing buffer.
+    """
+    for start in range(0, out.size, chunk):
+        stop = min(start + chunk, out.size)
+        np.multiply(np.arange(start, stop, dtype=out.dtype), step, out=out[start:stop])
+
+
+def cache_size(level, fallback):
+    """Size in bytes of the given cache level, or fallback if unknown"""
+    try:
+        size = os.sysconf(f"SC_LEVEL{level}_CACHE_SIZE")
+    except (AttributeError, ValueError, OSError):
+        return fallback
+    return size if size > 0 else fallback
+
+
+L2_BYTES = cache_size(2, 1 << 20)
+L3_BYTES = cache_size(3, 32 << 20)
+PEAK_DRAM_GBPS = 40.0  # rough dual-channel DDR4/DDR5 desktop estimate
+
+
+def bandwidth_str(size, itemsize, ns):
+    """Effective bandwidth of C = A + B (two reads + one write per element)"""
+    working_set = size * itemsize * 3
+    gbps = working_set / ns if ns > 0 else 0.0
+    if working_set <= L2_BYTES:
+        where = "L2-resident"
+    elif working_set <= L3_BYTES:
+        where = "L3-resident"
+    else:
+        where = "DRAM-bound"
+    text = f"{gbps:.1f} GB/s ({where})"
+    if where == "DRAM-bound" and gbps > 0.7 * PEAK_DRAM_GBPS:
+        text += "\n   ✅ kernel at bandwidth ceiling — further SIMD work won't help"
+    return text
+
+
+def is_aligned(arr, alignment=64):
     """Check if array is aligned to given byte boundary"""
     return arr.ctypes.data % alignment == 0
 
 
-def create_aligned_array(size, alignment=32, dtype=np.int64):
-    """Create an array that is guaranteed to be aligned to given byte boundary"""
+def create_aligned_array(size, alignment=64, dtype=np.int64):
+    """Create an array that is guaranteed to be aligned to given byte boundary
+
+    The memory is left uninitialized (np.empty, not calloc'd np.zeros), so
+    callers must write every element before reading it.
+    """
     # Allocate extra space and find aligned start
     itemsize = np.dtype(dtype).itemsize
     extra = alignment // itemsize
-    arr = np.zeros(size + extra, dtype=dtype)
+    arr = np.empty(size + extra, dtype=dtype)
     offset = (alignment - (arr.ctypes.data % alignment)) % alignment // itemsize
     return arr[offset : offset + size]
 
 
+def create_mapped_array(path, size, dtype=np.int64):
+    """Create a file-backed array; mmap'd pages are 4 KiB aligned (>= 64 B)"""
+    return np.memmap(path, dtype=dtype, mode="w+", shape=(size,))
+
+
+MADV_HUGEPAGE = 14  # <sys/mman.h> on Linux
+
+
+def thp_mode(knob="enabled"):
+    """Active transparent-hugepage mode ("always", "madvise", ...) or None"""
+    try:
+        with open(f"/sys/kernel/mm/transparent_hugepage/{knob}") as f:
+            modes = f.read().split()
+    except OSError:
+        return None
+    return next((m.strip("[]") for m in modes if m.startswith("[")), None)
+
+
+def advise_hugepages(arr, lock=False, shmem=False):
+    """madvise(MADV_HUGEPAGE) an array's pages and optionally mlock them
+
+    2 MiB pages cut dTLB misses on multi-GB streams by 512x; mlock keeps the
+    pages resident mid-benchmark. Both are hints here, so failures (no THP,
+    RLIMIT_MEMLOCK) come back in the status string instead of raising.
+    madvise succeeds even when THP is off, so the status also checks the
+    THP knob that governs the mapping: shmem_enabled for tmpfs-backed
+    buffers (`shmem`), enabled for anonymous memory.
+    """
+    if not sys.platform.startswith("linux"):
+        return "unsupported platform"
+    libc = ctypes.CDLL(None, use_errno=True)
+    libc.madvise.argtypes = [ctypes.c_void_p, ctypes.c_size_t, ctypes.c_int]
+    libc.mlock.argtypes = [ctypes.c_void_p, ctypes.c_size_t]
+
+    # madvise needs a page-aligned start; memmaps already are
+    page = os.sysconf("SC_PAGE_SIZE")
+    start = arr.ctypes.data - arr.ctypes.data % page
+    length = arr.ctypes.data + arr.nbytes - start
+
+    knob = "shmem_enabled" if shmem else "enabled"
+    mode = thp_mode(knob)
+    status = []
+    if libc.madvise(start, length, MADV_HUGEPAGE) != 0:
+        status.append(f"no hugepage ({os.strerror(ctypes.get_errno())})")
+    elif mode in (None, "never", "deny"):
+        status.append(f"no hugepage (THP {knob}={mode})")
+    else:
+        status.append("hugepage")
+    if lock:
+        if libc.mlock(start, length) == 0:
+            status.append("locked")
+        else:
+            status.append(f"not locked ({os.strerror(ctypes.get_errno())})")
+    return ", ".join(status)
+
+
+parser = argparse.ArgumentParser(description="NanoForge NumPy demo")
+parser.add_argument(
+    "--core",
+    type=int,
+    default=default_core(),
+    help="CPU core to pin the benchmark to (default: fastest allowed P-core)",
+)
+parser.add_argument(
+    "--mlock",
+    action="store_true",
+    help="mlock the 100M-element test buffers (needs RLIMIT_MEMLOCK headroom)",
+)
+args = parser.parse_args()
+
 print("╔══════════════════════════════════════════════════════════════╗")
 print("║     🔥 NanoForge NumPy Demo - AVX2 Acceleration 🔥          ║")
 print("╚══════════════════════════════════════════════════════════════╝\n")
@@ -55,7 +295,23 @@ print("╚═══════════════════════
 # 1. Check CPU features
 print(f"🖥️  CPU Features: {nanoforge.cpu_features()}")
 info = nanoforge.cpu_info()
-print(f"   AVX2: {info['avx2']}, AVX-512: {info['avx512f']}\n")
+print(f"   AVX2: {info['avx2']}, AVX-512: {info['avx512f']}")
+
+# Pin to one core and raise priority to cut migration / wakeup noise
+allowed_cpus = os.sched_getaffinity(0) if hasattr(os, "sched_getaffinity") else None
+pinned = pin_to_core(args.core)
+if pinned:
+    print(f"   📌 Pinned to core {args.core}")
+else:
+    print("   ⚠️ CPU pinning unavailable, timings may be noisy")
+try:
+    os.nice(-5)
+except (AttributeError, PermissionError):
+    pass
+freq = core_freq_mhz(args.core)
+if freq is not None:
+    print(f"   Core {args.core} frequency: {freq:.0f} MHz")
+print()
 
 # 2. Basic functionality test
 print("📋 Testing vec_add correctness...")
@@ -68,6 +324,17 @@ expected = a + b
 assert np.array_equal(c, expected), f"Mismatch: {c} != {expected}"
 print(f"   ✅ vec_add: {a} + {b} = {c}")
 
+for dtype, add_fn in [
+    (np.int32, nanoforge.vec_add_i32),
+    (np.float32, nanoforge.vec_add_f32),
+]:
+    a = np.arange(37, dtype=dtype)
+    b = np.arange(37, dtype=dtype) * 2
+    c = np.zeros(37, dtype=dtype)
+    add_fn(a, b, c)
+    assert np.array_equal(c, a + b), f"{add_fn.__name__} mismatch: {c} != {a + b}"
+    print(f"   ✅ {add_fn.__name__}: {np.dtype(dtype).name} matches a + b")
+
 # 3. Test vec_sum
 print("\n📋 Testing vec_sum correctness...")
 arr = np.arange(100, dtype=np.int64)
@@ -76,6 +343,11 @@ expected_sum = int(arr.sum())
 assert total == expected_sum, f"Sum mismatch: {total} != {expected_sum}"
 print(f"   ✅ vec_sum: sum(0..99) = {total}")
 
+arr = np.arange(100, dtype=np.int32)
+total = nanoforge.vec_sum_i32(arr)
+assert total == expected_sum, f"Sum mismatch: {total} != {expected_sum}"
+print(f"   ✅ vec_sum_i32: sum(0..99) = {total}")
+
 # 4. Test vec_scale
 print("\n📋 Testing vec_scale correctness...")
 arr = np.array([1, 2, 3, 4, 5], dtype=np.int64)
@@ -91,101 +363,202 @@ print("\n" + "=" * 64)
 print("🚀 PERFORMANCE BENCHMARK: NanoForge vs NumPy")
 print("=" * 64)
 
-import time
-
-for size in [1_000, 10_000, 100_000, 1_000_000, 10_000_000]:
-    # Create arrays
-    a = np.arange(size, dtype=np.int64)
-    b = np.arange(size, dtype=np.int64) * 2
-    c = np.zeros(size, dtype=np.int64)
-
-    iterations = 100 if size < 1_000_000 else 10
-
-    # Warmup
-    nanoforge.vec_add(a, b, c)
-    np.add(a, b, out=c)
-
-    # Benchmark NanoForge
-    start = time.perf_counter_ns()
-    for _ in range(iterations):
-        nanoforge.vec_add(a, b, c)
-    nanoforge_ns = (time.perf_counter_ns() - start) // iterations
-
-    # Benchmark NumPy
-    start = time.perf_counter_ns()
-    for _ in range(iterations):
-        np.add(a, b, out=c)
-    numpy_ns = (time.perf_counter_ns() - start) // iterations
-
-    # Calculate speedup
-    if nanoforge_ns > 0:
-        speedup = numpy_ns / nanoforge_ns
-        speedup_str = f"{speedup:.2f}x"
-        if speedup > 1:
-            speedup_str = f"✅ {speedup_str}"
+# Narrower element types move fewer bytes per element through the
+# memory-bound kernel, so large N should scale with 1 / itemsize.
+VEC_ADD_VARIANTS = [
+    (np.int64, nanoforge.vec_add),
+    (np.int32, nanoforge.vec_add_i32),
+    (np.float32, nanoforge.vec_add_f32),
+]
+
+SIZES = [1_000, 10_000, 100_000, 1_000_000, 10_000_000]
+max_size = max(SIZES)
+
+for dtype, add_fn in VEC_ADD_VARIANTS:
+    print(f"\n📊 {np.dtype(dtype).name} ({add_fn.__name__})")
+    print("-" * 64)
+
+    # Allocate once at the largest N; every size benchmarks an aligned slice
+    a_full = create_aligned_array(max_size, dtype=dtype)
+    b_full = create_aligned_array(max_size, dtype=dtype)
+    c_full = create_aligned_array(max_size, dtype=dtype)
+
+    # First touch: fault in every page up front, outside any timed region
+    fill_arange(a_full)
+    fill_arange(b_full, step=2)
+    np.add(a_full, b_full, out=c_full)
+
+    for size in SIZES:
+        a, b, c = a_full[:size], b_full[:size], c_full[:size]
+
+        namespace = {"vec_add": add_fn, "np": np, "a": a, "b": b, "c": c}
+
+        # Benchmark NanoForge
+        nanoforge_ns, nanoforge_wall_ns = bench_ns("vec_add(a, b, c)", namespace)
+
+        # Benchmark NumPy
+        numpy_ns, numpy_wall_ns = bench_ns("np.add(a, b, out=c)", namespace)
+
+        # Calculate speedup
+        if nanoforge_ns > 0:
+            speedup = numpy_ns / nanoforge_ns
+            speedup_str = f"{speedup:.2f}x"
+            if speedup > 1:
+                speedup_str = f"✅ {speedup_str}"
+            else:
+                speedup_str = f"❌ {speedup_str}"
         else:
-            speedup_str = f"❌ {speedup_str}"
-    else:
-        speedup_str = "∞"
+            speedup_str = "∞"
+
+        aligned = "🎯" if is_aligned(c) else ""
+        print(f"\n   N = {size:>10,} {aligned}")
+        print(f"   NanoForge: {cpu_wall_str(nanoforge_ns, nanoforge_wall_ns)}")
+        print(f"   NumPy:     {cpu_wall_str(numpy_ns, numpy_wall_ns)}")
+        print(f"   Speedup:   {speedup_str}")
+        print(f"   Bandwidth: {bandwidth_str(size, c.itemsize, nanoforge_ns)}")
+        freq = core_freq_mhz(args.core)
+        if freq is not None:
+            print(f"   Core freq: {freq:>7.0f} MHz")
+
+# 5b. int32 sum: 8 lanes per vector and half the bytes of the int64 sum
+print("\n" + "=" * 64)
+print("➕ vec_sum_i32 (8 x i32 lanes) vs vec_sum (4 x i64 lanes)")
+print("=" * 64)
 
-    aligned = "🎯" if is_aligned(c) else ""
-    print(f"\n   N = {size:>10,} {aligned}")
-    print(f"   NanoForge: {format_ns(nanoforge_ns):>10}")
-    print(f"   NumPy:     {format_ns(numpy_ns):>10}")
-    print(f"   Speedup:   {speedup_str}")
+for size in [1_000, 10_000, 100_000, 1_000_000]:
+    namespace = {
+        "nanoforge": nanoforge,
+        "a64": np.arange(size, dtype=np.int64),
+        "a32": np.arange(size, dtype=np.int32),
+    }
+    i64_ns, _ = bench_ns("nanoforge.vec_sum(a64)", namespace)
+    i32_ns, _ = bench_ns("nanoforge.vec_sum_i32(a32)", namespace)
+    gain = i64_ns / i32_ns if i32_ns > 0 else 0
+    print(
+        f"   N = {size:>9,}: i64 {format_ns(i64_ns):>10}  i32 {format_ns(i32_ns):>10}"
+        f"  ({gain:.2f}x)"
+    )
 
-# 6. Large scale test with FORCED 32-byte alignment for NT stores
+# 6. Odd lengths exercise the masked tail instead of the main loop. The tail is
+# what's left after the narrowest vector loop: n % 8 on AVX-512, n % 4 on AVX2.
+# Both vector tiers take any n, so even N=9 runs vectorized.
 print("\n" + "=" * 64)
-print("🧪 LARGE SCALE TEST: 100M elements (32-byte aligned for NT stores)")
+print("✂️  ODD-LENGTH TAILS: masked epilogue")
 print("=" * 64)
 
-size = 100_000_000
-print(f"   Allocating 3 x {size:,} int64 arrays ({size * 8 * 3 / 1e9:.1f} GB)...")
+tail_lanes = {"avx512": 8, "avx2": 4}.get(nanoforge.active_impl())
 
-try:
-    # Force 32-byte alignment for NT store path
-    a = create_aligned_array(size)
-    b = create_aligned_array(size)
-    c = create_aligned_array(size)
+for size in [9, 17, 33, 1023, 100_003]:
+    a = np.arange(size, dtype=np.int64)
+    b = np.arange(size, dtype=np.int64) * 2
+    c = np.zeros(size, dtype=np.int64)
 
-    # Initialize
-    a[:] = np.arange(size, dtype=np.int64)
-    b[:] = a * 2
-    c[:] = 0
+    nanoforge.vec_add(a, b, c)
+    assert np.array_equal(c, a + b), f"Tail mismatch at N={size}"
 
+    namespace = {"nanoforge": nanoforge, "np": np, "a": a, "b": b, "c": c}
+    nanoforge_ns, _ = bench_ns("nanoforge.vec_add(a, b, c)", namespace)
+    numpy_ns, _ = bench_ns("np.add(a, b, out=c)", namespace)
+    tail = f"tail {size % tail_lanes}" if tail_lanes else "scalar"
     print(
-        f"   Alignment: a={is_aligned(a)}, b={is_aligned(b)}, c={is_aligned(c)} (32-byte)"
+        f"   N = {size:>7,} ({tail}): NanoForge {format_ns(nanoforge_ns):>10}"
+        f"  NumPy {format_ns(numpy_ns):>10}  ✅"
     )
 
-    # NanoForge with NT stores
-    start = time.perf_counter_ns()
-    nanoforge.vec_add(a, b, c)
-    nanoforge_ns = time.perf_counter_ns() - start
-
-    # NumPy baseline
-    c[:] = 0  # Reset
-    start = time.perf_counter_ns()
-    np.add(a, b, out=c)
-    numpy_ns = time.perf_counter_ns() - start
-
-    speedup = numpy_ns / nanoforge_ns if nanoforge_ns > 0 else 0
-
-    print(f"   NanoForge: {format_ns(nanoforge_ns)} (NT stores enabled)")
-    print(f"   NumPy:     {format_ns(numpy_ns)}")
-    if speedup >= 1.0:
-        print(f"   Speedup:   ✅ {speedup:.2f}x")
-    else:
-        print(f"   Speedup:   {speedup:.2f}x")
-
-    # Verify correctness
-    expected = a + b
-    if np.array_equal(c, expected):
-        print("   ✅ Result verified correct!")
-    else:
-        print("   ❌ Result mismatch!")
+# 7. Large scale test on tmpfs-backed memmaps (page-aligned, so NT stores apply)
+print("\n" + "=" * 64)
+print("🧪 LARGE SCALE TEST: 100M elements (memmap on tmpfs, NT stores)")
+print("=" * 64)
 
-except MemoryError:
-    print("   ⚠️ Not enough memory for 100M test, skipping...")
+size = 100_000_000
+map_dir = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+paths = [os.path.join(map_dir, f"nf_{name}_{os.getpid()}.bin") for name in "abc"]
+needed = size * 8 * 3
+print(f"   Mapping 3 x {size:,} int64 arrays ({needed / 1e9:.1f} GB) in {map_dir}")
+
+if shutil.disk_usage(map_dir).free < needed:
+    # Writing past the end of a full tmpfs raises SIGBUS, not MemoryError
+    print(f"   ⚠️ Not enough space in {map_dir} for 100M test, skipping...")
+else:
+    try:
+        a, b, c = (create_mapped_array(path, size) for path in paths)
+
+        # Advise before first touch so the pages fault in as 2 MiB hugepages
+        print(
+            f"   THP: enabled={thp_mode()}, shmem_enabled={thp_mode('shmem_enabled')}"
+        )
+        shmem = map_dir == "/dev/shm"
+        for name, arr in zip("abc", (a, b, c)):
+            status = advise_hugepages(arr, lock=args.mlock, shmem=shmem)
+            print(f"   {name}: {status}")
+        if not args.mlock:
+            print("   mlock: off (pass --mlock to pin the buffers in RAM)")
+
+        # Initialize inputs and first-touch c: a fresh tmpfs file faults in
+        # (and zeroes) every page on first write, which would otherwise land
+        # in whichever timed run goes first
+        fill_arange(a)
+        fill_arange(b, step=2)
+        c[:] = 0
+
+        print(
+            f"   Alignment: a={is_aligned(a)}, b={is_aligned(b)}, c={is_aligned(c)} (64-byte)"
+        )
+
+        # NanoForge with NT stores
+        # (CPU time is the kernel-only figure; wall time shows interference)
+        nanoforge_ns, nanoforge_wall_ns = time_once_ns(nanoforge.vec_add, a, b, c)
+
+        # NumPy baseline
+        numpy_ns, numpy_wall_ns = time_once_ns(np.add, a, b, out=c)
+
+        speedup = numpy_ns / nanoforge_ns if nanoforge_ns > 0 else 0
+
+        print(f"   NanoForge: {cpu_wall_str(nanoforge_ns, nanoforge_wall_ns)}  (NT)")
+        print(f"   NumPy:     {cpu_wall_str(numpy_ns, numpy_wall_ns)}")
+        if speedup >= 1.0:
+            print(f"   Speedup:   ✅ {speedup:.2f}x")
+        else:
+            print(f"   Speedup:   {speedup:.2f}x")
+        print(f"   Bandwidth: {bandwidth_str(size, c.itemsize, nanoforge_ns)}")
+        freq = core_freq_mhz(args.core)
+        if freq is not None:
+            print(f"   Core freq: {freq:.0f} MHz")
+
+        # Thread scaling: vec_add releases the GIL, so both halves run at once.
+        # Expect ~2x only if one core can't saturate DRAM bandwidth on its own.
+        if allowed_cpus is not None and len(allowed_cpus) > 1:
+            os.sched_setaffinity(0, allowed_cpus)  # let the workers spread out
+            half = size // 2
+            with ThreadPoolExecutor(2) as pool:
+                start = time.perf_counter_ns()
+                futures = [
+                    pool.submit(nanoforge.vec_add, a[:half], b[:half], c[:half]),
+                    pool.submit(nanoforge.vec_add, a[half:], b[half:], c[half:]),
+                ]
+                for future in futures:
+                    future.result()
+                threaded_ns = time.perf_counter_ns() - start
+            if pinned:
+                pin_to_core(args.core)
+            # Workers' CPU time isn't on this thread's clock: compare wall to wall
+            scaling = nanoforge_wall_ns / threaded_ns if threaded_ns > 0 else 0
+            print(
+                f"   2 threads: {format_ns(threaded_ns)} ({scaling:.2f}x vs 1 thread)"
+            )
+
+        # Verify correctness in one fused pass (no 800 MB `a + b` temporary)
+        if nanoforge.vec_verify_add(a, b, c):
+            print("   ✅ Result verified correct!")
+        else:
+            print("   ❌ Result mismatch!")
+
+    finally:
+        # Drop the mappings before unlinking so tmpfs frees the pages
+        a = b = c = None
+        for path in paths:
+            if os.path.exists(path):
+                os.unlink(path)
 
 print(f"\n✅ NanoForge version: {nanoforge.version()}")
 print("🎉 All tests passed!")
@@ -37,6 +37,28 @@ impl SizeBucket {
         }
     }
 
+    /// Number of size buckets
+    pub const COUNT: usize = 5;
+
+    /// Lower bounds of every bucket after `Tiny`
+    const BOUNDS: [u64; 4] = [32, 256, 4096, 65536];
+
+    /// Row index of the bucket containing `n`
+    ///
+    /// Branchless: counts how many bucket lower bounds `n` has reached, so
+    /// the hot `select()` path has no data-dependent jumps.
+    pub fn index_for_size(n: u64) -> usize {
+        Self::BOUNDS
+            .iter()
+            .map(|&bound| (n >= bound) as usize)
+            .sum()
+    }
+
+    /// Row index of this bucket in per-bucket tables
+    pub fn index(&self) -> usize {
+        *self as usize
+    }
+
     /// Get all bucket variants for initialization
     pub fn all() -> Vec<SizeBucket> {
         vec![
@@ -151,21 +173,8 @@ impl VariantBandit {
     pub fn select(&mut self) -> usize {
         let mut rng = rand::thread_rng();
 
-        // Sample from each arm's Beta distribution
-        let samples: Vec<f64> = self
-            .successes
-            .iter()
-            .zip(&self.failures)
-            .map(|(&a, &b)| sample_beta(&mut rng, a, b))
-            .collect();
-
-        // Select the arm with highest sample
-        let selected = samples
-            .iter()
-            .enumerate()
-            .max_by(|(_, a), (_, b)| a.partial_cmp(b).unwrap())
-            .map(|(i, _)| i)
-            .unwrap_or(0);
+        // Sample from each arm's Beta distribution, keep the highest
+        let selected = thompson_select(&mut rng, &self.successes, &self.failures);
 
         self.selections[selected] += 1;
         selected
@@ -197,28 +206,16 @@ impl VariantBandit {
             return;
         }
 
-        // Calculate relative performance (0.0 = worst, 1.0 = best)
-        let performance_ratio = if cycles > 0 {
-            best_cycles as f64 / cycles as f64
-        } else {
-            0.0
-        };
+        let ratio = performance_ratio(cycles, best_cycles);
 
         // Update Beta parameters proportionally
-        self.successes[variant_idx] += performance_ratio;
-        self.failures[variant_idx] += 1.0 - performance_ratio;
+        self.successes[variant_idx] += ratio;
+        self.failures[variant_idx] += 1.0 - ratio;
     }
 
     /// Get the current best variant (highest expected value)
     pub fn get_best(&self) -> usize {
-        self.successes
-            .iter()
-            .zip(&self.failures)
-            .map(|(a, b)| a / (a + b)) // Expected value of Beta distribution
-            .enumerate()
-            .max_by(|(_, a), (_, b)| a.partial_cmp(b).unwrap())
-            .map(|(i, _)| i)
-            .unwrap_or(0)
+        best_expected(&self.successes, &self.failures)
     }
 
     /// Get statistics for all variants
@@ -278,6 +275,39 @@ pub struct VariantStats {
     pub confidence: f64,
 }
 
+/// Thompson-sample one arm from parallel Beta(α, β) parameter slices
+fn thompson_select<R: Rng>(rng: &mut R, successes: &[f64], failures: &[f64]) -> usize {
+    successes
+        .iter()
+        .zip(failures)
+        .map(|(&a, &b)| sample_beta(rng, a, b))
+        .enumerate()
+        .max_by(|(_, a), (_, b)| a.partial_cmp(b).unwrap())
+        .map(|(i, _)| i)
+        .unwrap_or(0)
+}
+
+/// Index of the arm with the highest Beta expected value α / (α + β)
+fn best_expected(successes: &[f64], failures: &[f64]) -> usize {
+    successes
+        .iter()
+        .zip(failures)
+        .map(|(a, b)| a / (a + b))
+        .enumerate()
+        .max_by(|(_, a), (_, b)| a.partial_cmp(b).unwrap())
+        .map(|(i, _)| i)
+        .unwrap_or(0)
+}
+
+/// Relative performance of a run (0.0 = worst, 1.0 = best)
+fn performance_ratio(cycles: u64, best_cycles: u64) -> f64 {
+    if cycles > 0 {
+        best_cycles as f64 / cycles as f64
+    } else {
+        0.0
+    }
+}
+
 /// Sample from Beta distribution using rejection sampling
 fn sample_beta<R: Rng>(rng: &mut R, alpha: f64, beta: f64) -> f64 {
     // Simple approximation using Gamma distribution
@@ -335,37 +365,119 @@ fn sample_normal<R: Rng>(rng: &mut R) -> f64 {
 /// - Learns that small inputs → Scalar is better
 /// - Learns that large inputs → AVX2 is better
 /// - Discovers the decision boundary automatically!
-#[derive(Debug, Serialize, Deserialize)]
+///
+/// Storage is structure-of-arrays: one flat `Vec` per Beta parameter, with
+/// bucket `b`'s arms at `b * num_variants..(b + 1) * num_variants`. `select`
+/// and `update` then touch one contiguous row instead of hashing into a map
+/// of per-bucket structs. The JSON format is still the per-bucket map.
+#[derive(Debug, Clone, Serialize, Deserialize)]
+#[serde(from = "ContextualBanditState", into = "ContextualBanditState")]
 pub struct ContextualBandit {
-    /// One bandit per size bucket
+    /// Number of variants (arms) per bucket
+    num_variants: usize,
+    /// Success counts (α), `SizeBucket::COUNT * num_variants` entries
+    successes: Vec<f64>,
+    /// Failure counts (β), same layout as `successes`
+    failures: Vec<f64>,
+    /// Total selections, same layout as `successes`
+    selections: Vec<u64>,
+    /// Variant names (shared across all buckets)
+    variant_names: Vec<String>,
+}
+
+/// On-disk form of `ContextualBandit`: one `VariantBandit` per bucket
+#[derive(Serialize, Deserialize)]
+struct ContextualBanditState {
     bandits: HashMap<SizeBucket, VariantBandit>,
-    /// Variant names (shared across all bandits)
     variant_names: Vec<String>,
 }
 
+impl From<ContextualBandit> for ContextualBanditState {
+    fn from(cb: ContextualBandit) -> Self {
+        let bandits = SizeBucket::all()
+            .into_iter()
+            .map(|bucket| {
+                let row = cb.row(bucket.index());
+                let bandit = VariantBandit {
+                    num_variants: cb.num_variants,
+                    successes: cb.successes[row.clone()].to_vec(),
+                    failures: cb.failures[row.clone()].to_vec(),
+                    variant_names: cb.variant_names.clone(),
+                    selections: cb.selections[row].to_vec(),
+                };
+                (bucket, bandit)
+            })
+            .collect();
+
+        Self {
+            bandits,
+            variant_names: cb.variant_names,
+        }
+    }
+}
+
+impl From<ContextualBanditState> for ContextualBandit {
+    fn from(state: ContextualBanditState) -> Self {
+        let mut cb = Self::new(state.variant_names);
+
+        // Buckets missing from the file keep their uniform priors
+        for (bucket, bandit) in &state.bandits {
+            let row = cb.row(bucket.index());
+            let k = cb
+                .num_variants
+                .min(bandit.successes.len())
+                .min(bandit.failures.len())
+                .min(bandit.selections.len());
+            cb.successes[row.start..row.start + k].copy_from_slice(&bandit.successes[..k]);
+            cb.failures[row.start..row.start + k].copy_from_slice(&bandit.failures[..k]);
+            cb.selections[row.start..row.start + k].copy_from_slice(&bandit.selections[..k]);
+        }
+
+        cb
+    }
+}
+
 impl ContextualBandit {
     /// Create a new contextual bandit
     pub fn new(variant_names: Vec<String>) -> Self {
-        let mut bandits = HashMap::new();
-
-        // Initialize a separate bandit for each size bucket
-        for bucket in SizeBucket::all() {
-            bandits.insert(bucket, VariantBandit::new(variant_names.clone()));
-        }
+        let n = variant_names.len();
+        let cells = SizeBucket::COUNT * n;
 
+        // Every bucket starts from the same Beta(1,1) = Uniform prior
         Self {
-            bandits,
+            num_variants: n,
+            successes: vec![1.0; cells],
+            failures: vec![1.0; cells],
+            selections: vec![0; cells],
             variant_names,
         }
     }
 
+    /// Index range of a bucket's arms in the flat parameter arrays
+    fn row(&self, bucket_idx: usize) -> std::ops::Range<usize> {
+        let start = bucket_idx * self.num_variants;
+        start..start + self.num_variants
+    }
+
+    /// Row of the bucket for this context
+    fn context_row(&self, context: &OptimizationFeatures) -> std::ops::Range<usize> {
+        self.row(SizeBucket::index_for_size(context.input_size))
+    }
+
     /// Select a variant based on context (input size)
     pub fn select(&mut self, context: &OptimizationFeatures) -> usize {
-        let bucket = context.size_bucket();
-        self.bandits
-            .get_mut(&bucket)
-            .map(|b| b.select())
-            .unwrap_or(0)
+        let row = self.context_row(context);
+        let mut rng = rand::thread_rng();
+        let selected = thompson_select(
+            &mut rng,
+            &self.successes[row.clone()],
+            &self.failures[row.clone()],
+        );
+
+        if let Some(count) = self.selections[row].get_mut(selected) {
+            *count += 1;
+        }
+        selected
     }
 
     /// Update the bandit for the specific context
@@ -375,9 +487,15 @@ impl ContextualBandit {
         variant_idx: usize,
         was_fastest: bool,
     ) {
-        let bucket = context.size_bucket();
-        if let Some(bandit) = self.bandits.get_mut(&bucket) {
-            bandit.update(variant_idx, was_fastest);
+        if variant_idx >= self.num_variants {
+            return;
+        }
+
+        let i = self.context_row(context).start + variant_idx;
+        if was_fastest {
+            self.successes[i] += 1.0;
+        } else {
+            self.failures[i] += 1.0;
         }
     }
 
@@ -389,37 +507,58 @@ impl ContextualBandit {
         cycles: u64,
         best_cycles: u64,
     ) {
-        let bucket = context.size_bucket();
-        if let Some(bandit) = self.bandits.get_mut(&bucket) {
-            bandit.update_with_performance(variant_idx, cycles, best_cycles);
+        if variant_idx >= self.num_variants {
+            return;
         }
+
+        let i = self.context_row(context).start + variant_idx;
+        let ratio = performance_ratio(cycles, best_cycles);
+        self.successes[i] += ratio;
+        self.failures[i] += 1.0 - ratio;
     }
 
     /// Get the best variant for a specific context
     pub fn get_best_for_context(&self, context: &OptimizationFeatures) -> usize {
-        let bucket = context.size_bucket();
-        self.bandits.get(&bucket).map(|b| b.get_best()).unwrap_or(0)
+        let row = self.context_row(context);
+        best_expected(&self.successes[row.clone()], &self.failures[row])
+    }
+
+    /// Get statistics for all variants in one bucket
+    pub fn get_bucket_stats(&self, bucket: SizeBucket) -> Vec<VariantStats> {
+        let row = self.row(bucket.index());
+        self.variant_names
+            .iter()
+            .zip(row)
+            .map(|(name, i)| VariantStats {
+                name: name.clone(),
+                selections: self.selections[i],
+                expected_value: self.successes[i] / (self.successes[i] + self.failures[i]),
+                confidence: self.successes[i] + self.failures[i],
+            })
+            .collect()
     }
 
     /// Get the learned decision boundary as a summary
     pub fn get_decision_boundary(&self) -> Vec<(SizeBucket, String, f64)> {
-        let mut decisions = Vec::new();
-
-        for bucket in SizeBucket::all() {
-            if let Some(bandit) = self.bandits.get(&bucket) {
-                let best_idx = bandit.get_best();
-                let stats = bandit.get_stats();
+        SizeBucket::all()
+            .into_iter()
+            .map(|bucket| {
+                let row = self.row(bucket.index());
+                let successes = &self.successes[row.clone()];
+                let failures = &self.failures[row];
+                let best_idx = best_expected(successes, failures);
                 let best_name = self
                     .variant_names
                     .get(best_idx)
                     .cloned()
                     .unwrap_or_default();
-                let expected = stats.get(best_idx).map(|s| s.expected_value).unwrap_or(0.0);
-                decisions.push((bucket, best_name, expected));
-            }
-        }
-
-        decisions
+                let expected = successes
+                    .get(best_idx)
+                    .map(|a| a / (a + failures[best_idx]))
+                    .unwrap_or(0.0);
+                (bucket, best_name, expected)
+            })
+            .collect()
     }
 
     /// Print the learned decision boundary
@@ -444,16 +583,13 @@ impl ContextualBandit {
     pub fn print_full_status(&self) {
         println!("\n📊 Contextual Bandit Full Status:");
         for bucket in SizeBucket::all() {
-            if let Some(bandit) = self.bandits.get(&bucket) {
-                println!("\n  📦 Bucket: {}", bucket);
-                let stats = bandit.get_stats();
-                for s in stats {
-                    let marker = if s.expected_value > 0.6 { "★" } else { " " };
-                    println!(
-                        "     {} {:12} exp={:.3} conf={:.1} sel={}",
-                        marker, s.name, s.expected_value, s.confidence, s.selections
-                    );
-                }
+            println!("\n  📦 Bucket: {}", bucket);
+            for s in self.get_bucket_stats(bucket) {
+                let marker = if s.expected_value > 0.6 { "★" } else { " " };
+                println!(
+                    "     {} {:12} exp={:.3} conf={:.1} sel={}",
+                    marker, s.name, s.expected_value, s.confidence, s.selections
+                );
             }
         }
     }
@@ -597,6 +733,49 @@ mod tests {
         assert_eq!(best, 1, "Should converge to AVX2x2");
     }
 
+    #[test]
+    fn test_bucket_index_matches_from_size() {
+        for n in [0, 31, 32, 255, 256, 4095, 4096, 65535, 65536, u64::MAX] {
+            assert_eq!(
+                SizeBucket::index_for_size(n),
+                SizeBucket::from_size(n).index(),
+                "Bucket mismatch for n = {}",
+                n
+            );
+        }
+        assert_eq!(SizeBucket::all().len(), SizeBucket::COUNT);
+    }
+
+    #[test]
+    fn test_contextual_bandit_learns_per_bucket() {
+        let names = vec!["Scalar".to_string(), "AVX2".to_string()];
+        let mut bandit = ContextualBandit::new(names);
+        let small = OptimizationFeatures::new(16);
+        let large = OptimizationFeatures::new(100_000);
+
+        for _ in 0..50 {
+            bandit.update_with_performance(&small, 0, 10, 10);
+            bandit.update_with_performance(&small, 1, 40, 10);
+            bandit.update_with_performance(&large, 0, 40, 10);
+            bandit.update_with_performance(&large, 1, 10, 10);
+        }
+
+        assert_eq!(bandit.get_best_for_context(&small), 0);
+        assert_eq!(bandit.get_best_for_context(&large), 1);
+
+        let boundary = bandit.get_decision_boundary();
+        assert_eq!(boundary.len(), SizeBucket::COUNT);
+        assert_eq!(boundary[0].0, SizeBucket::Tiny);
+        assert_eq!(boundary[0].1, "Scalar");
+        assert_eq!(boundary[4].1, "AVX2");
+
+        // Round-trips through the per-bucket JSON format
+        let json = serde_json::to_string(&bandit).unwrap();
+        let restored: ContextualBandit = serde_json::from_str(&json).unwrap();
+        assert_eq!(restored.successes, bandit.successes);
+        assert_eq!(restored.failures, bandit.failures);
+    }
+
     #[test]
     fn test_contextual_selector() {
         let names = vec!["Scalar".to_string(), "AVX2".to_string()];
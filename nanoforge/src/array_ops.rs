@@ -8,6 +8,8 @@
 //! - 4x loop unrolling (16 elements per iteration using 8 YMM registers)
 //! - Aggressive prefetching (2 cache lines ahead)
 //! - Non-temporal stores for large arrays (>1MB) to bypass cache
+//! - Masked vec_add tails (AVX-512 k-masks / AVX2 vpmaskmovq, vpmaskmovd)
+//!   instead of scalar epilogues
 
 use crate::cpu_features::CpuFeatures;
 use crate::jit_memory::DualMappedMemory;
@@ -17,56 +19,196 @@ use std::sync::OnceLock;
 // Threshold for using non-temporal stores (elements)
 // 1MB of i64 = 131072 elements
 const NT_STORE_THRESHOLD: usize = 131072;
+// 1MB of i32/f32 = 262144 elements
+const NT_STORE_THRESHOLD_32: usize = 262144;
 
 /// Cached JIT function for vec_add (regular stores)
-struct CachedVecAdd {
+struct CachedVecAdd<T> {
     #[allow(dead_code)]
     memory: DualMappedMemory,
-    func: extern "C" fn(*const i64, *const i64, *mut i64, usize),
+    func: extern "C" fn(*const T, *const T, *mut T, usize),
 }
 
-unsafe impl Send for CachedVecAdd {}
-unsafe impl Sync for CachedVecAdd {}
+unsafe impl<T> Send for CachedVecAdd<T> {}
+unsafe impl<T> Sync for CachedVecAdd<T> {}
+
+static VEC_ADD_AVX2: OnceLock<CachedVecAdd<i64>> = OnceLock::new();
+static VEC_ADD_AVX2_NT: OnceLock<CachedVecAdd<i64>> = OnceLock::new();
+static VEC_ADD_AVX512: OnceLock<CachedVecAdd<i64>> = OnceLock::new();
+static VEC_ADD_AVX512_NT: OnceLock<CachedVecAdd<i64>> = OnceLock::new();
+static VEC_ADD_I32_AVX2: OnceLock<CachedVecAdd<i32>> = OnceLock::new();
+static VEC_ADD_I32_AVX2_NT: OnceLock<CachedVecAdd<i32>> = OnceLock::new();
+static VEC_ADD_F32_AVX2: OnceLock<CachedVecAdd<f32>> = OnceLock::new();
+static VEC_ADD_F32_AVX2_NT: OnceLock<CachedVecAdd<f32>> = OnceLock::new();
+
+/// Implementation tier a kernel dispatches to on this CPU
+#[derive(Debug, Clone, Copy, PartialEq, Eq, PartialOrd, Ord)]
+pub enum KernelTier {
+    Scalar,
+    Avx2,
+    Avx512,
+}
+
+impl KernelTier {
+    pub fn name(&self) -> &'static str {
+        match self {
+            KernelTier::Scalar => "scalar",
+            KernelTier::Avx2 => "avx2",
+            KernelTier::Avx512 => "avx512",
+        }
+    }
+}
+
+/// Per-kernel dispatch decisions, resolved once per process
+///
+/// The kernels below consult this table instead of re-running CPUID on
+/// every call, so what `dispatch()` reports is exactly what runs.
+#[derive(Debug, Clone)]
+pub struct DispatchTable {
+    pub vec_add: KernelTier,
+    pub vec_add_i32: KernelTier,
+    pub vec_add_f32: KernelTier,
+    pub vec_sum: KernelTier,
+    pub vec_sum_i32: KernelTier,
+    pub vec_scale: KernelTier,
+    pub vec_verify_add: KernelTier,
+}
+
+impl DispatchTable {
+    /// Highest tier each kernel has an implementation for
+    pub const IMPLEMENTED: DispatchTable = DispatchTable {
+        vec_add: KernelTier::Avx512,
+        vec_add_i32: KernelTier::Avx2,
+        vec_add_f32: KernelTier::Avx2,
+        vec_sum: KernelTier::Avx2,
+        vec_sum_i32: KernelTier::Avx2,
+        vec_scale: KernelTier::Scalar,
+        vec_verify_add: KernelTier::Avx2,
+    };
+
+    fn detect(features: &CpuFeatures) -> Self {
+        // is_x86_feature_detected! also checks that the OS saves ZMM state
+        let cpu_tier = if features.has_avx512f && std::arch::is_x86_feature_detected!("avx512f") {
+            KernelTier::Avx512
+        } else if features.has_avx2 {
+            KernelTier::Avx2
+        } else {
+            KernelTier::Scalar
+        };
+
+        // Each kernel runs the best tier both it and the CPU support
+        let max = &Self::IMPLEMENTED;
+        Self {
+            vec_add: cpu_tier.min(max.vec_add),
+            vec_add_i32: cpu_tier.min(max.vec_add_i32),
+            vec_add_f32: cpu_tier.min(max.vec_add_f32),
+            vec_sum: cpu_tier.min(max.vec_sum),
+            vec_sum_i32: cpu_tier.min(max.vec_sum_i32),
+            vec_scale: cpu_tier.min(max.vec_scale),
+            vec_verify_add: cpu_tier.min(max.vec_verify_add),
+        }
+    }
+
+    /// (kernel name, selected tier) pairs
+    pub fn entries(&self) -> Vec<(&'static str, KernelTier)> {
+        vec![
+            ("vec_add", self.vec_add),
+            ("vec_add_i32", self.vec_add_i32),
+            ("vec_add_f32", self.vec_add_f32),
+            ("vec_sum", self.vec_sum),
+            ("vec_sum_i32", self.vec_sum_i32),
+            ("vec_scale", self.vec_scale),
+            ("vec_verify_add", self.vec_verify_add),
+        ]
+    }
+}
 
-static VEC_ADD_AVX2: OnceLock<CachedVecAdd> = OnceLock::new();
-static VEC_ADD_AVX2_NT: OnceLock<CachedVecAdd> = OnceLock::new();
+static DISPATCH: OnceLock<DispatchTable> = OnceLock::new();
+
+/// Get the cached dispatch table for this CPU
+pub fn dispatch() -> &'static DispatchTable {
+    DISPATCH.get_or_init(|| DispatchTable::detect(&CpuFeatures::detect()))
+}
+
+/// Tier `vec_add_i64` dispatches to on this CPU: "scalar", "avx2" or "avx512"
+///
+/// Every tier's kernel is generated at runtime for the host it runs on, so a
+/// build made on an AVX2-only machine still picks AVX-512 when moved to one.
+pub fn active_impl() -> &'static str {
+    dispatch().vec_add.name()
+}
+
+/// Lane type for the 32-bit (8 lanes per YMM) vec_add kernels
+#[derive(Debug, Clone, Copy)]
+enum Lane32 {
+    I32,
+    F32,
+}
 
 /// Cached JIT function for vec_sum
-struct CachedVecSum {
+struct CachedVecSum<T> {
     #[allow(dead_code)]
     memory: DualMappedMemory,
-    func: extern "C" fn(*const i64, usize) -> i64,
+    func: extern "C" fn(*const T, usize) -> i64,
 }
 
-unsafe impl Send for CachedVecSum {}
-unsafe impl Sync for CachedVecSum {}
+unsafe impl<T> Send for CachedVecSum<T> {}
+unsafe impl<T> Sync for CachedVecSum<T> {}
+
+static VEC_SUM_AVX2: OnceLock<CachedVecSum<i64>> = OnceLock::new();
+
+/// Cached JIT function for vec_verify_add (returns 1 if C == A + B)
+struct CachedVecVerify {
+    #[allow(dead_code)]
+    memory: DualMappedMemory,
+    func: extern "C" fn(*const i64, *const i64, *const i64, usize) -> u64,
+}
+
+unsafe impl Send for CachedVecVerify {}
+unsafe impl Sync for CachedVecVerify {}
+
+static VEC_VERIFY_ADD_AVX2: OnceLock<CachedVecVerify> = OnceLock::new();
+static VEC_SUM_I32_AVX2: OnceLock<CachedVecSum<i32>> = OnceLock::new();
 
-static VEC_SUM_AVX2: OnceLock<CachedVecSum> = OnceLock::new();
+// Elements per vec_sum_i32 kernel call: 4 accumulators x 8 lanes, each
+// lane taking at most 65536 adds (65534 unrolled + up to 2 in the 8-wide
+// loop), so the high-half sums fit in i32 and the low-half sums in u32
+const SUM_I32_CHUNK: usize = 32 * 65534;
 
 /// Vector addition: C[i] = A[i] + B[i]
-/// Uses AVX2 for 4x i64 parallelism when available
+/// Uses AVX-512 (8x i64) or AVX2 (4x i64) when available, with masked tails
 /// For arrays > 1MB with aligned output, uses non-temporal stores
 pub fn vec_add_i64(a: &[i64], b: &[i64], c: &mut [i64]) {
     let n = a.len().min(b.len()).min(c.len());
-
-    let features = CpuFeatures::detect();
-
-    if features.has_avx2 && n >= 16 {
-        // Check if output is 32-byte aligned for NT stores
-        let c_aligned = (c.as_ptr() as usize) % 32 == 0;
-
-        if n >= NT_STORE_THRESHOLD && c_aligned {
-            // Large array with aligned output: use non-temporal stores
-            let cached = VEC_ADD_AVX2_NT.get_or_init(|| {
-                init_vec_add_avx2_nt().expect("Failed to initialize AVX2 NT vec_add")
-            });
-            (cached.func)(a.as_ptr(), b.as_ptr(), c.as_mut_ptr(), n);
-        } else {
-            // Small/medium array or unaligned: use regular stores
-            let cached = VEC_ADD_AVX2
-                .get_or_init(|| init_vec_add_avx2().expect("Failed to initialize AVX2 vec_add"));
-            (cached.func)(a.as_ptr(), b.as_ptr(), c.as_mut_ptr(), n);
-        }
+    let tier = dispatch().vec_add;
+
+    // NT stores need the output aligned to the vector width
+    let c_addr = c.as_ptr() as usize;
+    let c_aligned_32 = c_addr % 32 == 0;
+    let c_aligned_64 = c_addr % 64 == 0;
+
+    if tier == KernelTier::Avx512 && n >= NT_STORE_THRESHOLD && c_aligned_64 {
+        // Large array with cacheline-aligned output: 512-bit NT stores
+        let cached = VEC_ADD_AVX512_NT.get_or_init(|| {
+            init_vec_add_avx512(true).expect("Failed to initialize AVX-512 NT vec_add")
+        });
+        (cached.func)(a.as_ptr(), b.as_ptr(), c.as_mut_ptr(), n);
+    } else if tier >= KernelTier::Avx2 && n >= NT_STORE_THRESHOLD && c_aligned_32 {
+        // Large array with aligned output: use non-temporal stores
+        let cached = VEC_ADD_AVX2_NT
+            .get_or_init(|| init_vec_add_avx2_nt().expect("Failed to initialize AVX2 NT vec_add"));
+        (cached.func)(a.as_ptr(), b.as_ptr(), c.as_mut_ptr(), n);
+    } else if tier == KernelTier::Avx512 {
+        // Any size: the k-masked tail covers n % 8 (including n < 8)
+        let cached = VEC_ADD_AVX512.get_or_init(|| {
+            init_vec_add_avx512(false).expect("Failed to initialize AVX-512 vec_add")
+        });
+        (cached.func)(a.as_ptr(), b.as_ptr(), c.as_mut_ptr(), n);
+    } else if tier == KernelTier::Avx2 {
+        // Any size, regular stores: the vpmaskmovq tail covers n % 4
+        let cached = VEC_ADD_AVX2
+            .get_or_init(|| init_vec_add_avx2().expect("Failed to initialize AVX2 vec_add"));
+        (cached.func)(a.as_ptr(), b.as_ptr(), c.as_mut_ptr(), n);
     } else {
         // Scalar fallback
         for i in 0..n {
@@ -76,7 +218,7 @@ pub fn vec_add_i64(a: &[i64], b: &[i64], c: &mut [i64]) {
 }
 
 /// Initialize cached AVX2 vec_add function (regular stores)
-fn init_vec_add_avx2() -> Result<CachedVecAdd, String> {
+fn init_vec_add_avx2() -> Result<CachedVecAdd<i64>, String> {
     let code = generate_vec_add_avx2_regular()?;
 
     let memory = DualMappedMemory::new(code.len().max(4096))
@@ -94,7 +236,7 @@ fn init_vec_add_avx2() -> Result<CachedVecAdd, String> {
 }
 
 /// Initialize cached AVX2 vec_add function with non-temporal stores
-fn init_vec_add_avx2_nt() -> Result<CachedVecAdd, String> {
+fn init_vec_add_avx2_nt() -> Result<CachedVecAdd<i64>, String> {
     let code = generate_vec_add_avx2_nt()?;
 
     let memory = DualMappedMemory::new(code.len().max(4096))
@@ -163,7 +305,7 @@ fn generate_vec_add_avx2_regular() -> Result<Vec<u8>, String> {
         ; mov rax, rbx
         ; sub rax, rcx
         ; cmp rax, 4
-        ; jl ->scalar_cleanup
+        ; jl ->masked_tail
 
         ; vmovdqu ymm0, [r13 + rcx * 8]
         ; vmovdqu ymm1, [rsi + rcx * 8]
@@ -173,16 +315,13 @@ fn generate_vec_add_avx2_regular() -> Result<Vec<u8>, String> {
         ; add rcx, 4
         ; jmp ->vec_loop_4
 
-        ; ->scalar_cleanup:
-        ; cmp rcx, rbx
-        ; jge ->done
+        ; ->masked_tail:
+    );
 
-        ; mov rax, [r13 + rcx * 8]
-        ; add rax, [rsi + rcx * 8]
-        ; mov [r12 + rcx * 8], rax
-        ; inc rcx
-        ; jmp ->scalar_cleanup
+    emit_avx2_masked_tail_i64(&mut ops);
 
+    dynasm!(ops
+        ; .arch x64
         ; ->done:
         ; pop r13
         ; pop r12
@@ -191,6 +330,8 @@ fn generate_vec_add_avx2_regular() -> Result<Vec<u8>, String> {
         ; ret
     );
 
+    emit_avx2_tail_mask_table(&mut ops);
+
     let buf = ops.finalize().map_err(|e| format!("{:?}", e))?;
     Ok(buf.to_vec())
 }
@@ -255,7 +396,7 @@ fn generate_vec_add_avx2_nt() -> Result<Vec<u8>, String> {
         ; mov rax, rbx
         ; sub rax, rcx
         ; cmp rax, 4
-        ; jl ->scalar_cleanup
+        ; jl ->masked_tail
 
         ; vmovdqu ymm0, [r13 + rcx * 8]
         ; vmovdqu ymm1, [rsi + rcx * 8]
@@ -265,17 +406,14 @@ fn generate_vec_add_avx2_nt() -> Result<Vec<u8>, String> {
         ; add rcx, 4
         ; jmp ->vec_loop_4
 
-        // Scalar cleanup (regular stores for remainder)
-        ; ->scalar_cleanup:
-        ; cmp rcx, rbx
-        ; jge ->done
+        // Masked cleanup (regular stores for remainder)
+        ; ->masked_tail:
+    );
 
-        ; mov rax, [r13 + rcx * 8]
-        ; add rax, [rsi + rcx * 8]
-        ; mov [r12 + rcx * 8], rax
-        ; inc rcx
-        ; jmp ->scalar_cleanup
+    emit_avx2_masked_tail_i64(&mut ops);
 
+    dynasm!(ops
+        ; .arch x64
         ; ->done:
         ; sfence              // Ensure all NT stores complete before return
         ; pop r13
@@ -285,6 +423,460 @@ fn generate_vec_add_avx2_nt() -> Result<Vec<u8>, String> {
         ; ret
     );
 
+    emit_avx2_tail_mask_table(&mut ops);
+
+    let buf = ops.finalize().map_err(|e| format!("{:?}", e))?;
+    Ok(buf.to_vec())
+}
+
+/// Emit the AVX2 i64 vec_add tail for the 0-3 elements left after the
+/// 4-wide loop, using vpmaskmovq so masked-off lanes are never touched.
+/// Expects r13 = A, rsi = B, r12 = C, rcx = i, rbx = n; jumps to `->done`.
+fn emit_avx2_masked_tail_i64(ops: &mut Assembler) {
+    dynasm!(ops
+        ; .arch x64
+        ; mov rax, rbx
+        ; sub rax, rcx          // rax = tail (0..3)
+        ; jz ->done
+
+        // Lanes [4 - tail, 8 - tail) of the table: first `tail` are all-ones
+        ; lea rdx, [->tail_masks]
+        ; neg rax
+        ; vmovdqu ymm2, [rdx + rax * 8 + 32]
+
+        ; vpmaskmovq ymm0, ymm2, [r13 + rcx * 8]
+        ; vpmaskmovq ymm1, ymm2, [rsi + rcx * 8]
+        ; vpaddq ymm0, ymm0, ymm1
+        ; vpmaskmovq [r12 + rcx * 8], ymm2, ymm0
+    );
+}
+
+/// Emit the AVX2 32-bit vec_add tail for the 0-7 elements left after the
+/// 8-wide loop, using vpmaskmovd so masked-off lanes are never touched.
+/// Same register contract as `emit_avx2_masked_tail_i64`.
+fn emit_avx2_masked_tail_32(ops: &mut Assembler, kind: Lane32) {
+    dynasm!(ops
+        ; .arch x64
+        ; mov rax, rbx
+        ; sub rax, rcx          // rax = tail (0..7)
+        ; jz ->done
+
+        // Lanes [8 - tail, 16 - tail) of the table: first `tail` are all-ones
+        ; lea rdx, [->tail_masks]
+        ; neg rax
+        ; vmovdqu ymm2, [rdx + rax * 4 + 32]
+
+        ; vpmaskmovd ymm0, ymm2, [r13 + rcx * 4]
+        ; vpmaskmovd ymm1, ymm2, [rsi + rcx * 4]
+    );
+
+    match kind {
+        Lane32::I32 => dynasm!(ops
+            ; .arch x64
+            ; vpaddd ymm0, ymm0, ymm1
+        ),
+        Lane32::F32 => dynasm!(ops
+            ; .arch x64
+            ; vaddps ymm0, ymm0, ymm1
+        ),
+    }
+
+    dynasm!(ops
+        ; .arch x64
+        ; vpmaskmovd [r12 + rcx * 4], ymm2, ymm0
+    );
+}
+
+/// Emit the `->tail_masks` table used by the AVX2 masked tails: 32 bytes of
+/// all-ones followed by 32 zero bytes
+fn emit_avx2_tail_mask_table(ops: &mut Assembler) {
+    dynasm!(ops
+        ; .arch x64
+        ; .align 8
+        ; ->tail_masks:
+    );
+    ops.extend([0xFFu8; 32].iter());
+    ops.extend([0x00u8; 32].iter());
+}
+
+// dynasm-rs can't encode EVEX (see assembler/avx512.rs), so the AVX-512
+// vec_add body is emitted as bytes pre-assembled with GNU as. Operands are
+// fixed: r13 = A, rsi = B, r12 = C, rcx = element index, edx = tail mask.
+
+/// vmovdqu64 zmm0..zmm3, [r13 + rcx * 8 + 0/64/128/192]
+/// vpaddq    zmm0..zmm3, zmm0..zmm3, [rsi + rcx * 8 + 0/64/128/192]
+const EVEX_LOAD_ADD_X4: [u8; 63] = [
+    0x62, 0xD1, 0xFE, 0x48, 0x6F, 0x44, 0xCD, 0x00, // vmovdqu64 zmm0, [r13+rcx*8]
+    0x62, 0xD1, 0xFE, 0x48, 0x6F, 0x4C, 0xCD, 0x01, // vmovdqu64 zmm1, [r13+rcx*8+64]
+    0x62, 0xD1, 0xFE, 0x48, 0x6F, 0x54, 0xCD, 0x02, // vmovdqu64 zmm2, [r13+rcx*8+128]
+    0x62, 0xD1, 0xFE, 0x48, 0x6F, 0x5C, 0xCD, 0x03, // vmovdqu64 zmm3, [r13+rcx*8+192]
+    0x62, 0xF1, 0xFD, 0x48, 0xD4, 0x04, 0xCE, // vpaddq zmm0, zmm0, [rsi+rcx*8]
+    0x62, 0xF1, 0xF5, 0x48, 0xD4, 0x4C, 0xCE, 0x01, // vpaddq zmm1, zmm1, [rsi+rcx*8+64]
+    0x62, 0xF1, 0xED, 0x48, 0xD4, 0x54, 0xCE, 0x02, // vpaddq zmm2, zmm2, [rsi+rcx*8+128]
+    0x62, 0xF1, 0xE5, 0x48, 0xD4, 0x5C, 0xCE, 0x03, // vpaddq zmm3, zmm3, [rsi+rcx*8+192]
+];
+
+/// vmovdqu64 [r12 + rcx * 8 + 0/64/128/192], zmm0..zmm3
+const EVEX_STORE_X4: [u8; 31] = [
+    0x62, 0xD1, 0xFE, 0x48, 0x7F, 0x04, 0xCC, // vmovdqu64 [r12+rcx*8], zmm0
+    0x62, 0xD1, 0xFE, 0x48, 0x7F, 0x4C, 0xCC, 0x01, // vmovdqu64 [r12+rcx*8+64], zmm1
+    0x62, 0xD1, 0xFE, 0x48, 0x7F, 0x54, 0xCC, 0x02, // vmovdqu64 [r12+rcx*8+128], zmm2
+    0x62, 0xD1, 0xFE, 0x48, 0x7F, 0x5C, 0xCC, 0x03, // vmovdqu64 [r12+rcx*8+192], zmm3
+];
+
+/// vmovntdq [r12 + rcx * 8 + 0/64/128/192], zmm0..zmm3 (64-byte aligned C)
+const EVEX_STREAM_X4: [u8; 31] = [
+    0x62, 0xD1, 0x7D, 0x48, 0xE7, 0x04, 0xCC, // vmovntdq [r12+rcx*8], zmm0
+    0x62, 0xD1, 0x7D, 0x48, 0xE7, 0x4C, 0xCC, 0x01, // vmovntdq [r12+rcx*8+64], zmm1
+    0x62, 0xD1, 0x7D, 0x48, 0xE7, 0x54, 0xCC, 0x02, // vmovntdq [r12+rcx*8+128], zmm2
+    0x62, 0xD1, 0x7D, 0x48, 0xE7, 0x5C, 0xCC, 0x03, // vmovntdq [r12+rcx*8+192], zmm3
+];
+
+/// One 8-element step: load A, add B (store follows separately)
+const EVEX_LOAD_ADD_X1: [u8; 15] = [
+    0x62, 0xD1, 0xFE, 0x48, 0x6F, 0x44, 0xCD, 0x00, // vmovdqu64 zmm0, [r13+rcx*8]
+    0x62, 0xF1, 0xFD, 0x48, 0xD4, 0x04, 0xCE, // vpaddq zmm0, zmm0, [rsi+rcx*8]
+];
+
+/// vmovdqu64 [r12 + rcx * 8], zmm0
+const EVEX_STORE_X1: [u8; 7] = [0x62, 0xD1, 0xFE, 0x48, 0x7F, 0x04, 0xCC];
+
+/// vmovntdq [r12 + rcx * 8], zmm0
+const EVEX_STREAM_X1: [u8; 7] = [0x62, 0xD1, 0x7D, 0x48, 0xE7, 0x04, 0xCC];
+
+/// Masked tail: k1 = edx, then a zero-masked load/add/masked store.
+/// Masked-off lanes are neither loaded nor stored, so they can't fault.
+const EVEX_MASKED_ADD: [u8; 32] = [
+    0xC5, 0xF8, 0x92, 0xCA, // kmovw k1, edx
+    0x62, 0xD1, 0xFE, 0xC9, 0x6F, 0x44, 0xCD, 0x00, // vmovdqu64 zmm0{k1}{z}, [r13+rcx*8]
+    0x62, 0xF1, 0xFE, 0xC9, 0x6F, 0x0C, 0xCE, // vmovdqu64 zmm1{k1}{z}, [rsi+rcx*8]
+    0x62, 0xF1, 0xFD, 0x48, 0xD4, 0xC1, // vpaddq zmm0, zmm0, zmm1
+    0x62, 0xD1, 0xFE, 0x49, 0x7F, 0x04, 0xCC, // vmovdqu64 [r12+rcx*8]{k1}, zmm0
+];
+
+/// Initialize cached AVX-512 vec_add function
+fn init_vec_add_avx512(nt: bool) -> Result<CachedVecAdd<i64>, String> {
+    let code = generate_vec_add_avx512(nt)?;
+
+    let memory = DualMappedMemory::new(code.len().max(4096))
+        .map_err(|e| format!("Failed to allocate JIT memory: {}", e))?;
+
+    unsafe {
+        std::ptr::copy_nonoverlapping(code.as_ptr(), memory.rw_ptr, code.len());
+    }
+    memory.flush_icache();
+
+    let func: extern "C" fn(*const i64, *const i64, *mut i64, usize) =
+        unsafe { std::mem::transmute(memory.rx_ptr) };
+
+    Ok(CachedVecAdd { memory, func })
+}
+
+/// Generate AVX-512 vector add: 32 elements per iteration, then 8, then a
+/// single k-masked step for the final n % 8 elements (no scalar epilogue)
+/// When `nt` is set, the output buffer (rdx) MUST be 64-byte aligned
+fn generate_vec_add_avx512(nt: bool) -> Result<Vec<u8>, String> {
+    let mut ops = Assembler::new().map_err(|e| e.to_string())?;
+
+    dynasm!(ops
+        ; .arch x64
+        ; push rbx
+        ; push r12
+        ; push r13
+        ; mov rbx, rcx          // rbx = n
+        ; mov r12, rdx          // r12 = C
+        ; mov r13, rdi          // r13 = A
+
+        ; xor rcx, rcx          // rcx = i = 0
+
+        // Main loop: 32 elements (4 ZMM) per iteration
+        ; .align 32
+        ; ->vec_loop_32:
+        ; mov rax, rbx
+        ; sub rax, rcx
+        ; cmp rax, 32
+        ; jl ->vec_loop_8
+
+        ; prefetcht0 [r13 + rcx * 8 + 256]
+        ; prefetcht0 [rsi + rcx * 8 + 256]
+    );
+    ops.extend(EVEX_LOAD_ADD_X4.iter());
+    if nt {
+        ops.extend(EVEX_STREAM_X4.iter());
+    } else {
+        ops.extend(EVEX_STORE_X4.iter());
+    }
+    dynasm!(ops
+        ; .arch x64
+        ; add rcx, 32
+        ; jmp ->vec_loop_32
+
+        // Secondary loop: 8 elements
+        ; ->vec_loop_8:
+        ; mov rax, rbx
+        ; sub rax, rcx
+        ; cmp rax, 8
+        ; jl ->masked_tail
+    );
+    ops.extend(EVEX_LOAD_ADD_X1.iter());
+    if nt {
+        ops.extend(EVEX_STREAM_X1.iter());
+    } else {
+        ops.extend(EVEX_STORE_X1.iter());
+    }
+    dynasm!(ops
+        ; .arch x64
+        ; add rcx, 8
+        ; jmp ->vec_loop_8
+
+        // Masked tail: rax = n - i (0..7), mask = (1 << rax) - 1
+        ; ->masked_tail:
+        ; test rax, rax
+        ; jz ->done
+        ; mov r8, rcx
+        ; mov ecx, eax
+        ; mov edx, 1
+        ; shl edx, cl
+        ; dec edx
+        ; mov rcx, r8
+    );
+    ops.extend(EVEX_MASKED_ADD.iter());
+    dynasm!(ops
+        ; .arch x64
+        ; ->done:
+    );
+    if nt {
+        dynasm!(ops
+            ; .arch x64
+            ; sfence              // Ensure all NT stores complete before return
+        );
+    }
+    dynasm!(ops
+        ; .arch x64
+        ; pop r13
+        ; pop r12
+        ; pop rbx
+        ; vzeroupper
+        ; ret
+    );
+
+    let buf = ops.finalize().map_err(|e| format!("{:?}", e))?;
+    Ok(buf.to_vec())
+}
+
+/// Vector addition for 32-bit integers: C[i] = A[i] + B[i] (wrapping)
+/// Uses AVX2 for 8x i32 parallelism, halving memory traffic vs i64
+pub fn vec_add_i32(a: &[i32], b: &[i32], c: &mut [i32]) {
+    let n = a.len().min(b.len()).min(c.len());
+
+    // Any size: the vpmaskmovd tail covers n % 8 (including n < 8)
+    if dispatch().vec_add_i32 == KernelTier::Avx2 {
+        let c_aligned = (c.as_ptr() as usize) % 32 == 0;
+        let nt = n >= NT_STORE_THRESHOLD_32 && c_aligned;
+        let lock = if nt {
+            &VEC_ADD_I32_AVX2_NT
+        } else {
+            &VEC_ADD_I32_AVX2
+        };
+        let cached = lock.get_or_init(|| {
+            init_vec_add_avx2_32(Lane32::I32, nt).expect("Failed to initialize AVX2 vec_add_i32")
+        });
+        (cached.func)(a.as_ptr(), b.as_ptr(), c.as_mut_ptr(), n);
+    } else {
+        for i in 0..n {
+            c[i] = a[i].wrapping_add(b[i]);
+        }
+    }
+}
+
+/// Vector addition for 32-bit floats: C[i] = A[i] + B[i]
+/// Uses AVX2 for 8x f32 parallelism, halving memory traffic vs i64
+pub fn vec_add_f32(a: &[f32], b: &[f32], c: &mut [f32]) {
+    let n = a.len().min(b.len()).min(c.len());
+
+    // Any size: the vpmaskmovd tail covers n % 8 (including n < 8)
+    if dispatch().vec_add_f32 == KernelTier::Avx2 {
+        let c_aligned = (c.as_ptr() as usize) % 32 == 0;
+        let nt = n >= NT_STORE_THRESHOLD_32 && c_aligned;
+        let lock = if nt {
+            &VEC_ADD_F32_AVX2_NT
+        } else {
+            &VEC_ADD_F32_AVX2
+        };
+        let cached = lock.get_or_init(|| {
+            init_vec_add_avx2_32(Lane32::F32, nt).expect("Failed to initialize AVX2 vec_add_f32")
+        });
+        (cached.func)(a.as_ptr(), b.as_ptr(), c.as_mut_ptr(), n);
+    } else {
+        for i in 0..n {
+            c[i] = a[i] + b[i];
+        }
+    }
+}
+
+/// Initialize cached AVX2 vec_add function for 32-bit lanes
+fn init_vec_add_avx2_32<T>(kind: Lane32, nt: bool) -> Result<CachedVecAdd<T>, String> {
+    let code = generate_vec_add_avx2_32(kind, nt)?;
+
+    let memory = DualMappedMemory::new(code.len().max(4096))
+        .map_err(|e| format!("Failed to allocate JIT memory: {}", e))?;
+
+    unsafe {
+        std::ptr::copy_nonoverlapping(code.as_ptr(), memory.rw_ptr, code.len());
+    }
+    memory.flush_icache();
+
+    let func: extern "C" fn(*const T, *const T, *mut T, usize) =
+        unsafe { std::mem::transmute(memory.rx_ptr) };
+
+    Ok(CachedVecAdd { memory, func })
+}
+
+/// Generate AVX2 vector add for 32-bit lanes (i32 via vpaddd, f32 via vaddps)
+/// When `nt` is set, the output buffer (rdx) MUST be 32-byte aligned
+fn generate_vec_add_avx2_32(kind: Lane32, nt: bool) -> Result<Vec<u8>, String> {
+    let mut ops = Assembler::new().map_err(|e| e.to_string())?;
+
+    dynasm!(ops
+        ; .arch x64
+        ; push rbx
+        ; push r12
+        ; push r13
+        ; mov rbx, rcx          // rbx = n
+        ; mov r12, rdx          // r12 = C
+        ; mov r13, rdi          // r13 = A
+
+        ; xor rcx, rcx          // rcx = i = 0
+
+        // Main loop: 32 elements per iteration
+        ; .align 32
+        ; ->vec_loop_32:
+        ; mov rax, rbx
+        ; sub rax, rcx
+        ; cmp rax, 32
+        ; jl ->vec_loop_8
+
+        ; prefetcht0 [r13 + rcx * 4 + 128]
+        ; prefetcht0 [rsi + rcx * 4 + 128]
+
+        ; vmovdqu ymm0, [r13 + rcx * 4]
+        ; vmovdqu ymm1, [r13 + rcx * 4 + 32]
+        ; vmovdqu ymm2, [r13 + rcx * 4 + 64]
+        ; vmovdqu ymm3, [r13 + rcx * 4 + 96]
+
+        ; vmovdqu ymm4, [rsi + rcx * 4]
+        ; vmovdqu ymm5, [rsi + rcx * 4 + 32]
+        ; vmovdqu ymm6, [rsi + rcx * 4 + 64]
+        ; vmovdqu ymm7, [rsi + rcx * 4 + 96]
+    );
+
+    match kind {
+        Lane32::I32 => dynasm!(ops
+            ; .arch x64
+            ; vpaddd ymm0, ymm0, ymm4
+            ; vpaddd ymm1, ymm1, ymm5
+            ; vpaddd ymm2, ymm2, ymm6
+            ; vpaddd ymm3, ymm3, ymm7
+        ),
+        Lane32::F32 => dynasm!(ops
+            ; .arch x64
+            ; vaddps ymm0, ymm0, ymm4
+            ; vaddps ymm1, ymm1, ymm5
+            ; vaddps ymm2, ymm2, ymm6
+            ; vaddps ymm3, ymm3, ymm7
+        ),
+    }
+
+    if nt {
+        dynasm!(ops
+            ; .arch x64
+            ; vmovntdq [r12 + rcx * 4], ymm0
+            ; vmovntdq [r12 + rcx * 4 + 32], ymm1
+            ; vmovntdq [r12 + rcx * 4 + 64], ymm2
+            ; vmovntdq [r12 + rcx * 4 + 96], ymm3
+        );
+    } else {
+        dynasm!(ops
+            ; .arch x64
+            ; vmovdqu [r12 + rcx * 4], ymm0
+            ; vmovdqu [r12 + rcx * 4 + 32], ymm1
+            ; vmovdqu [r12 + rcx * 4 + 64], ymm2
+            ; vmovdqu [r12 + rcx * 4 + 96], ymm3
+        );
+    }
+
+    dynasm!(ops
+        ; .arch x64
+        ; add rcx, 32
+        ; jmp ->vec_loop_32
+
+        // Secondary loop: 8 elements
+        ; ->vec_loop_8:
+        ; mov rax, rbx
+        ; sub rax, rcx
+        ; cmp rax, 8
+        ; jl ->masked_tail
+
+        ; vmovdqu ymm0, [r13 + rcx * 4]
+        ; vmovdqu ymm1, [rsi + rcx * 4]
+    );
+
+    match kind {
+        Lane32::I32 => dynasm!(ops
+            ; .arch x64
+            ; vpaddd ymm0, ymm0, ymm1
+        ),
+        Lane32::F32 => dynasm!(ops
+            ; .arch x64
+            ; vaddps ymm0, ymm0, ymm1
+        ),
+    }
+
+    if nt {
+        dynasm!(ops
+            ; .arch x64
+            ; vmovntdq [r12 + rcx * 4], ymm0
+        );
+    } else {
+        dynasm!(ops
+            ; .arch x64
+            ; vmovdqu [r12 + rcx * 4], ymm0
+        );
+    }
+
+    dynasm!(ops
+        ; .arch x64
+        ; add rcx, 8
+        ; jmp ->vec_loop_8
+
+        ; ->masked_tail:
+    );
+
+    emit_avx2_masked_tail_32(&mut ops, kind);
+
+    dynasm!(ops
+        ; .arch x64
+        ; ->done:
+    );
+
+    if nt {
+        dynasm!(ops
+            ; .arch x64
+            ; sfence              // Ensure all NT stores complete before return
+        );
+    }
+
+    dynasm!(ops
+        ; .arch x64
+        ; pop r13
+        ; pop r12
+        ; pop rbx
+        ; vzeroupper
+        ; ret
+    );
+
+    emit_avx2_tail_mask_table(&mut ops);
+
     let buf = ops.finalize().map_err(|e| format!("{:?}", e))?;
     Ok(buf.to_vec())
 }
@@ -293,9 +885,7 @@ fn generate_vec_add_avx2_nt() -> Result<Vec<u8>, String> {
 pub fn vec_sum_i64(arr: &[i64]) -> i64 {
     let n = arr.len();
 
-    let features = CpuFeatures::detect();
-
-    if features.has_avx2 && n >= 16 {
+    if dispatch().vec_sum == KernelTier::Avx2 && n >= 16 {
         let cached = VEC_SUM_AVX2
             .get_or_init(|| init_vec_sum_avx2().expect("Failed to initialize AVX2 vec_sum"));
         (cached.func)(arr.as_ptr(), n)
@@ -304,7 +894,7 @@ pub fn vec_sum_i64(arr: &[i64]) -> i64 {
     }
 }
 
-fn init_vec_sum_avx2() -> Result<CachedVecSum, String> {
+fn init_vec_sum_avx2() -> Result<CachedVecSum<i64>, String> {
     let code = generate_vec_sum_avx2_ultra()?;
 
     let memory = DualMappedMemory::new(code.len().max(4096))
@@ -394,6 +984,310 @@ fn generate_vec_sum_avx2_ultra() -> Result<Vec<u8>, String> {
     Ok(buf.to_vec())
 }
 
+/// Vector sum of 32-bit integers, widened to an exact i64 result
+///
+/// Packs 8 lanes per YMM (vs 4 for i64). Each element is added whole
+/// (wrapping) and as its signed high half; the exact low-half sum is
+/// recovered as `full - (high << 16)`, and both are widened to i64 once per
+/// `SUM_I32_CHUNK` elements so no lane can overflow.
+pub fn vec_sum_i32(arr: &[i32]) -> i64 {
+    let n = arr.len();
+
+    if dispatch().vec_sum_i32 == KernelTier::Avx2 && n >= 32 {
+        let cached = VEC_SUM_I32_AVX2.get_or_init(|| {
+            init_vec_sum_i32_avx2().expect("Failed to initialize AVX2 vec_sum_i32")
+        });
+
+        let vector_len = n & !7;
+        let mut total: i64 = 0;
+        for chunk in arr[..vector_len].chunks(SUM_I32_CHUNK) {
+            total += (cached.func)(chunk.as_ptr(), chunk.len());
+        }
+        total + arr[vector_len..].iter().map(|&x| x as i64).sum::<i64>()
+    } else {
+        arr.iter().map(|&x| x as i64).sum()
+    }
+}
+
+fn init_vec_sum_i32_avx2() -> Result<CachedVecSum<i32>, String> {
+    let code = generate_vec_sum_i32_avx2()?;
+
+    let memory = DualMappedMemory::new(code.len().max(4096))
+        .map_err(|e| format!("Failed to allocate JIT memory: {}", e))?;
+
+    unsafe {
+        std::ptr::copy_nonoverlapping(code.as_ptr(), memory.rw_ptr, code.len());
+    }
+    memory.flush_icache();
+
+    let func: extern "C" fn(*const i32, usize) -> i64 =
+        unsafe { std::mem::transmute(memory.rx_ptr) };
+
+    Ok(CachedVecSum { memory, func })
+}
+
+/// Generate AVX2 i32 sum over one chunk
+/// REQUIRES: n is a multiple of 8 and n <= SUM_I32_CHUNK
+fn generate_vec_sum_i32_avx2() -> Result<Vec<u8>, String> {
+    let mut ops = Assembler::new().map_err(|e| e.to_string())?;
+
+    dynasm!(ops
+        ; .arch x64
+        // 4 independent (full, high) accumulator pairs: ymm0-3 take the
+        // wrapping sum of x, ymm4-7 the sum of x >> 16 (arithmetic)
+        ; vpxor ymm0, ymm0, ymm0
+        ; vpxor ymm1, ymm1, ymm1
+        ; vpxor ymm2, ymm2, ymm2
+        ; vpxor ymm3, ymm3, ymm3
+        ; vpxor ymm4, ymm4, ymm4
+        ; vpxor ymm5, ymm5, ymm5
+        ; vpxor ymm6, ymm6, ymm6
+        ; vpxor ymm7, ymm7, ymm7
+
+        ; xor rcx, rcx
+        ; mov rdx, rsi
+        ; and rdx, -32            // rdx = n rounded down to 32
+
+        // Main loop: 32 elements, no cross-iteration dependency between pairs
+        ; .align 32
+        ; ->sum_loop_32:
+        ; cmp rcx, rdx
+        ; jge ->sum_loop_8
+
+        ; vmovdqu ymm8, [rdi + rcx * 4]
+        ; vmovdqu ymm9, [rdi + rcx * 4 + 32]
+        ; vmovdqu ymm10, [rdi + rcx * 4 + 64]
+        ; vmovdqu ymm11, [rdi + rcx * 4 + 96]
+
+        ; vpaddd ymm0, ymm0, ymm8
+        ; vpaddd ymm1, ymm1, ymm9
+        ; vpaddd ymm2, ymm2, ymm10
+        ; vpaddd ymm3, ymm3, ymm11
+
+        ; vpsrad ymm8, ymm8, 16
+        ; vpsrad ymm9, ymm9, 16
+        ; vpsrad ymm10, ymm10, 16
+        ; vpsrad ymm11, ymm11, 16
+
+        ; vpaddd ymm4, ymm4, ymm8
+        ; vpaddd ymm5, ymm5, ymm9
+        ; vpaddd ymm6, ymm6, ymm10
+        ; vpaddd ymm7, ymm7, ymm11
+
+        ; add rcx, 32
+        ; jmp ->sum_loop_32
+
+        // Remaining multiple of 8 goes into the first pair
+        ; ->sum_loop_8:
+        ; cmp rcx, rsi
+        ; jge ->sum_reduce
+
+        ; vmovdqu ymm8, [rdi + rcx * 4]
+        ; vpaddd ymm0, ymm0, ymm8
+        ; vpsrad ymm8, ymm8, 16
+        ; vpaddd ymm4, ymm4, ymm8
+
+        ; add rcx, 8
+        ; jmp ->sum_loop_8
+
+        // Per pair: low-half sum = full - (high << 16), exact as a u32
+        ; ->sum_reduce:
+        ; vpslld ymm8, ymm4, 16
+        ; vpsubd ymm0, ymm0, ymm8
+        ; vpslld ymm9, ymm5, 16
+        ; vpsubd ymm1, ymm1, ymm9
+        ; vpslld ymm10, ymm6, 16
+        ; vpsubd ymm2, ymm2, ymm10
+        ; vpslld ymm11, ymm7, 16
+        ; vpsubd ymm3, ymm3, ymm11
+
+        // Widen: low sums zero-extended into ymm12, high sums sign-extended
+        // into ymm13
+        ; vpmovzxdq ymm12, xmm0
+        ; vextracti128 xmm0, ymm0, 1
+        ; vpmovzxdq ymm0, xmm0
+        ; vpaddq ymm12, ymm12, ymm0
+        ; vpmovzxdq ymm0, xmm1
+        ; vpaddq ymm12, ymm12, ymm0
+        ; vextracti128 xmm1, ymm1, 1
+        ; vpmovzxdq ymm1, xmm1
+        ; vpaddq ymm12, ymm12, ymm1
+        ; vpmovzxdq ymm0, xmm2
+        ; vpaddq ymm12, ymm12, ymm0
+        ; vextracti128 xmm2, ymm2, 1
+        ; vpmovzxdq ymm2, xmm2
+        ; vpaddq ymm12, ymm12, ymm2
+        ; vpmovzxdq ymm0, xmm3
+        ; vpaddq ymm12, ymm12, ymm0
+        ; vextracti128 xmm3, ymm3, 1
+        ; vpmovzxdq ymm3, xmm3
+        ; vpaddq ymm12, ymm12, ymm3
+
+        ; vpmovsxdq ymm13, xmm4
+        ; vextracti128 xmm4, ymm4, 1
+        ; vpmovsxdq ymm4, xmm4
+        ; vpaddq ymm13, ymm13, ymm4
+        ; vpmovsxdq ymm0, xmm5
+        ; vpaddq ymm13, ymm13, ymm0
+        ; vextracti128 xmm5, ymm5, 1
+        ; vpmovsxdq ymm5, xmm5
+        ; vpaddq ymm13, ymm13, ymm5
+        ; vpmovsxdq ymm0, xmm6
+        ; vpaddq ymm13, ymm13, ymm0
+        ; vextracti128 xmm6, ymm6, 1
+        ; vpmovsxdq ymm6, xmm6
+        ; vpaddq ymm13, ymm13, ymm6
+        ; vpmovsxdq ymm0, xmm7
+        ; vpaddq ymm13, ymm13, ymm0
+        ; vextracti128 xmm7, ymm7, 1
+        ; vpmovsxdq ymm7, xmm7
+        ; vpaddq ymm13, ymm13, ymm7
+
+        // Recombine: high * 65536 + low, then horizontal sum
+        ; vpsllq ymm13, ymm13, 16
+        ; vpaddq ymm0, ymm12, ymm13
+        ; vextracti128 xmm1, ymm0, 1
+        ; vpaddq xmm0, xmm0, xmm1
+        ; vpsrldq xmm1, xmm0, 8
+        ; vpaddq xmm0, xmm0, xmm1
+        ; vmovq rax, xmm0
+
+        ; vzeroupper
+        ; ret
+    );
+
+    let buf = ops.finalize().map_err(|e| format!("{:?}", e))?;
+    Ok(buf.to_vec())
+}
+
+/// Check that C[i] == A[i] + B[i] for every element, without allocating
+///
+/// One fused streaming pass: add, vpcmpeqq against C and vmovmskpd, exiting
+/// on the first mismatching block. Returns false if the lengths differ.
+pub fn vec_verify_add_i64(a: &[i64], b: &[i64], c: &[i64]) -> bool {
+    let n = a.len();
+    if b.len() != n || c.len() != n {
+        return false;
+    }
+
+    if dispatch().vec_verify_add == KernelTier::Avx2 && n >= 16 {
+        let cached = VEC_VERIFY_ADD_AVX2.get_or_init(|| {
+            init_vec_verify_add_avx2().expect("Failed to initialize AVX2 vec_verify_add")
+        });
+        (cached.func)(a.as_ptr(), b.as_ptr(), c.as_ptr(), n) != 0
+    } else {
+        a.iter()
+            .zip(b)
+            .zip(c)
+            .all(|((&x, &y), &z)| x.wrapping_add(y) == z)
+    }
+}
+
+fn init_vec_verify_add_avx2() -> Result<CachedVecVerify, String> {
+    let code = generate_vec_verify_add_avx2()?;
+
+    let memory = DualMappedMemory::new(code.len().max(4096))
+        .map_err(|e| format!("Failed to allocate JIT memory: {}", e))?;
+
+    unsafe {
+        std::ptr::copy_nonoverlapping(code.as_ptr(), memory.rw_ptr, code.len());
+    }
+    memory.flush_icache();
+
+    let func: extern "C" fn(*const i64, *const i64, *const i64, usize) -> u64 =
+        unsafe { std::mem::transmute(memory.rx_ptr) };
+
+    Ok(CachedVecVerify { memory, func })
+}
+
+/// Generate AVX2 fused add-and-compare: returns 1 if C == A + B, else 0
+fn generate_vec_verify_add_avx2() -> Result<Vec<u8>, String> {
+    let mut ops = Assembler::new().map_err(|e| e.to_string())?;
+
+    dynasm!(ops
+        ; .arch x64
+        ; xor r8, r8            // r8 = i = 0
+
+        // Main loop: 16 elements, one movemask per iteration
+        ; .align 32
+        ; ->verify_loop_16:
+        ; mov rax, rcx
+        ; sub rax, r8
+        ; cmp rax, 16
+        ; jl ->verify_loop_4
+
+        ; prefetcht0 [rdi + r8 * 8 + 128]
+        ; prefetcht0 [rsi + r8 * 8 + 128]
+        ; prefetcht0 [rdx + r8 * 8 + 128]
+
+        ; vmovdqu ymm0, [rdi + r8 * 8]
+        ; vmovdqu ymm1, [rdi + r8 * 8 + 32]
+        ; vmovdqu ymm2, [rdi + r8 * 8 + 64]
+        ; vmovdqu ymm3, [rdi + r8 * 8 + 96]
+
+        ; vpaddq ymm0, ymm0, [rsi + r8 * 8]
+        ; vpaddq ymm1, ymm1, [rsi + r8 * 8 + 32]
+        ; vpaddq ymm2, ymm2, [rsi + r8 * 8 + 64]
+        ; vpaddq ymm3, ymm3, [rsi + r8 * 8 + 96]
+
+        ; vpcmpeqq ymm0, ymm0, [rdx + r8 * 8]
+        ; vpcmpeqq ymm1, ymm1, [rdx + r8 * 8 + 32]
+        ; vpcmpeqq ymm2, ymm2, [rdx + r8 * 8 + 64]
+        ; vpcmpeqq ymm3, ymm3, [rdx + r8 * 8 + 96]
+
+        ; vpand ymm0, ymm0, ymm1
+        ; vpand ymm2, ymm2, ymm3
+        ; vpand ymm0, ymm0, ymm2
+        ; vmovmskpd eax, ymm0
+        ; cmp eax, 0xF
+        ; jne ->mismatch
+
+        ; add r8, 16
+        ; jmp ->verify_loop_16
+
+        // Secondary loop: 4 elements
+        ; ->verify_loop_4:
+        ; mov rax, rcx
+        ; sub rax, r8
+        ; cmp rax, 4
+        ; jl ->scalar_cleanup
+
+        ; vmovdqu ymm0, [rdi + r8 * 8]
+        ; vpaddq ymm0, ymm0, [rsi + r8 * 8]
+        ; vpcmpeqq ymm0, ymm0, [rdx + r8 * 8]
+        ; vmovmskpd eax, ymm0
+        ; cmp eax, 0xF
+        ; jne ->mismatch
+
+        ; add r8, 4
+        ; jmp ->verify_loop_4
+
+        ; ->scalar_cleanup:
+        ; cmp r8, rcx
+        ; jge ->all_equal
+
+        ; mov rax, [rdi + r8 * 8]
+        ; add rax, [rsi + r8 * 8]
+        ; cmp rax, [rdx + r8 * 8]
+        ; jne ->mismatch
+        ; inc r8
+        ; jmp ->scalar_cleanup
+
+        ; ->all_equal:
+        ; mov eax, 1
+        ; vzeroupper
+        ; ret
+
+        ; ->mismatch:
+        ; xor eax, eax
+        ; vzeroupper
+        ; ret
+    );
+
+    let buf = ops.finalize().map_err(|e| format!("{:?}", e))?;
+    Ok(buf.to_vec())
+}
+
 /// In-place scale: arr[i] *= scalar
 pub fn vec_scale_i64(arr: &mut [i64], scalar: i64) {
     for x in arr.iter_mut() {
@@ -465,6 +1359,187 @@ mod tests {
         assert_eq!(c, expected);
     }
 
+    #[test]
+    fn test_vec_add_nt_aligned() {
+        // Carve a 64-byte aligned window so the NT-store kernels are taken
+        let n = NT_STORE_THRESHOLD + 13;
+        let a: Vec<i64> = (0..n as i64).collect();
+        let b: Vec<i64> = (0..n as i64).map(|x| x * 2).collect();
+        let mut backing = vec![0i64; n + 8];
+        let offset = backing.as_ptr().align_offset(64);
+        let c = &mut backing[offset..offset + n];
+
+        vec_add_i64(&a, &b, c);
+
+        for i in 0..n {
+            assert_eq!(c[i], a[i] + b[i], "Mismatch at index {}", i);
+        }
+    }
+
+    #[test]
+    fn test_vec_add_odd_tails() {
+        for n in (0..=40).chain([1023, 100_003]) {
+            let a: Vec<i64> = (0..n as i64).map(|x| x * 3 + 1).collect();
+            let b: Vec<i64> = (0..n as i64).map(|x| -x * 7).collect();
+            let mut c = vec![42i64; n];
+
+            vec_add_i64(&a, &b, &mut c);
+
+            let expected: Vec<i64> = a.iter().zip(b.iter()).map(|(x, y)| x + y).collect();
+            assert_eq!(c, expected, "Mismatch for n = {}", n);
+        }
+    }
+
+    #[test]
+    fn test_vec_add_i32() {
+        let n = 1_003;
+        let a: Vec<i32> = (0..n).collect();
+        let b: Vec<i32> = (0..n).map(|x| x * 2).collect();
+        let mut c = vec![0i32; n as usize];
+
+        vec_add_i32(&a, &b, &mut c);
+
+        let expected: Vec<i32> = a.iter().zip(b.iter()).map(|(x, y)| x + y).collect();
+        assert_eq!(c, expected);
+    }
+
+    #[test]
+    fn test_vec_add_f32() {
+        let n = 1_003;
+        let a: Vec<f32> = (0..n).map(|x| x as f32 * 0.5).collect();
+        let b: Vec<f32> = (0..n).map(|x| x as f32 * 2.0).collect();
+        let mut c = vec![0f32; n as usize];
+
+        vec_add_f32(&a, &b, &mut c);
+
+        let expected: Vec<f32> = a.iter().zip(b.iter()).map(|(x, y)| x + y).collect();
+        assert_eq!(c, expected);
+    }
+
+    #[test]
+    fn test_vec_add_32_odd_tails() {
+        for n in 0..=40 {
+            let a: Vec<i32> = (0..n as i32).map(|x| x * 3 + 1).collect();
+            let b: Vec<i32> = (0..n as i32).map(|x| -x * 7).collect();
+            let mut c = vec![42i32; n];
+            vec_add_i32(&a, &b, &mut c);
+            let expected: Vec<i32> = a.iter().zip(b.iter()).map(|(x, y)| x + y).collect();
+            assert_eq!(c, expected, "i32 mismatch for n = {}", n);
+
+            let a: Vec<f32> = (0..n).map(|x| x as f32 * 0.5).collect();
+            let b: Vec<f32> = (0..n).map(|x| x as f32 * 2.0).collect();
+            let mut c = vec![42f32; n];
+            vec_add_f32(&a, &b, &mut c);
+            let expected: Vec<f32> = a.iter().zip(b.iter()).map(|(x, y)| x + y).collect();
+            assert_eq!(c, expected, "f32 mismatch for n = {}", n);
+        }
+    }
+
+    #[test]
+    fn test_vec_add_i32_nt_aligned() {
+        // Carve a 32-byte aligned window so the NT-store kernel is taken
+        let n = NT_STORE_THRESHOLD_32 + 13;
+        let a: Vec<i32> = (0..n as i32).collect();
+        let b: Vec<i32> = (0..n as i32).map(|x| x.wrapping_mul(-3)).collect();
+        let mut backing = vec![0i32; n + 8];
+        let offset = backing.as_ptr().align_offset(32);
+        let c = &mut backing[offset..offset + n];
+
+        vec_add_i32(&a, &b, c);
+
+        for i in 0..n {
+            assert_eq!(c[i], a[i].wrapping_add(b[i]), "Mismatch at index {}", i);
+        }
+    }
+
+    #[test]
+    fn test_vec_add_f32_nt_aligned() {
+        // Carve a 32-byte aligned window so the NT-store kernel is taken
+        let n = NT_STORE_THRESHOLD_32 + 13;
+        let a: Vec<f32> = (0..n).map(|x| x as f32 * 0.5).collect();
+        let b: Vec<f32> = (0..n).map(|x| x as f32 * 2.0).collect();
+        let mut backing = vec![0f32; n + 8];
+        let offset = backing.as_ptr().align_offset(32);
+        let c = &mut backing[offset..offset + n];
+
+        vec_add_f32(&a, &b, c);
+
+        for i in 0..n {
+            assert_eq!(c[i], a[i] + b[i], "Mismatch at index {}", i);
+        }
+    }
+
+    /// Call a vec_add kernel directly for every tail length. The output
+    /// window starts `align` bytes aligned and is followed by sentinels, so
+    /// a store to a masked-off lane past n is caught.
+    fn check_add_kernel<T>(
+        kernel: &CachedVecAdd<T>,
+        align: usize,
+        sentinel: T,
+        lane: impl Fn(usize) -> (T, T),
+    ) where
+        T: Copy + PartialEq + std::fmt::Debug + std::ops::Add<Output = T>,
+    {
+        let guard = 16;
+        for n in (0..=40).chain([1023, 4099]) {
+            let (a, b): (Vec<T>, Vec<T>) = (0..n).map(&lane).unzip();
+            let mut backing = vec![sentinel; n + guard + align / std::mem::size_of::<T>()];
+            let offset = backing.as_ptr().align_offset(align);
+            let c = &mut backing[offset..offset + n + guard];
+
+            (kernel.func)(a.as_ptr(), b.as_ptr(), c.as_mut_ptr(), n);
+
+            for i in 0..n {
+                assert_eq!(c[i], a[i] + b[i], "Mismatch at index {} for n = {}", i, n);
+            }
+            assert!(
+                c[n..].iter().all(|&x| x == sentinel),
+                "Store past the end for n = {}",
+                n
+            );
+        }
+    }
+
+    fn lane_i64(i: usize) -> (i64, i64) {
+        (i as i64 * 3 + 1, -(i as i64) * 7)
+    }
+
+    fn lane_i32(i: usize) -> (i32, i32) {
+        (i as i32 * 3 + 1, -(i as i32) * 7)
+    }
+
+    fn lane_f32(i: usize) -> (f32, f32) {
+        (i as f32 * 0.5, i as f32 * 2.0)
+    }
+
+    #[test]
+    fn test_vec_add_avx2_kernels() {
+        if !std::arch::is_x86_feature_detected!("avx2") {
+            return;
+        }
+
+        check_add_kernel(&init_vec_add_avx2().unwrap(), 8, i64::MIN, lane_i64);
+        check_add_kernel(&init_vec_add_avx2_nt().unwrap(), 32, i64::MIN, lane_i64);
+
+        for nt in [false, true] {
+            let align = if nt { 32 } else { 4 };
+            let i32_kernel = init_vec_add_avx2_32::<i32>(Lane32::I32, nt).unwrap();
+            check_add_kernel(&i32_kernel, align, i32::MIN, lane_i32);
+            let f32_kernel = init_vec_add_avx2_32::<f32>(Lane32::F32, nt).unwrap();
+            check_add_kernel(&f32_kernel, align, -1.0, lane_f32);
+        }
+    }
+
+    #[test]
+    fn test_vec_add_avx512_kernels() {
+        if !std::arch::is_x86_feature_detected!("avx512f") {
+            return;
+        }
+
+        check_add_kernel(&init_vec_add_avx512(false).unwrap(), 8, i64::MIN, lane_i64);
+        check_add_kernel(&init_vec_add_avx512(true).unwrap(), 64, i64::MIN, lane_i64);
+    }
+
     #[test]
     fn test_vec_sum() {
         let arr: Vec<i64> = (1..=100).collect();
@@ -482,6 +1557,79 @@ mod tests {
         assert_eq!(result, expected);
     }
 
+    #[test]
+    fn test_vec_sum_i32() {
+        let arr: Vec<i32> = (0..1_003).collect();
+        let expected: i64 = (0..1_003i64).sum();
+        assert_eq!(vec_sum_i32(&arr), expected);
+    }
+
+    #[test]
+    fn test_vec_sum_i32_extremes() {
+        // Spans several chunks and would overflow any unsplit i32 lane
+        let n = SUM_I32_CHUNK * 2 + 13;
+        let arr: Vec<i32> = (0..n)
+            .map(|i| if i % 3 == 0 { i32::MIN } else { i32::MAX })
+            .collect();
+        let expected: i64 = arr.iter().map(|&x| x as i64).sum();
+        assert_eq!(vec_sum_i32(&arr), expected);
+
+        // Worst case for the high-half accumulators: every lane at its add
+        // limit, including a chunk whose length isn't a multiple of 32
+        for n in [SUM_I32_CHUNK, SUM_I32_CHUNK - 8] {
+            let arr = vec![i32::MIN; n];
+            assert_eq!(vec_sum_i32(&arr), i32::MIN as i64 * n as i64);
+            let arr = vec![i32::MAX; n];
+            assert_eq!(vec_sum_i32(&arr), i32::MAX as i64 * n as i64);
+        }
+    }
+
+    #[test]
+    fn test_vec_verify_add() {
+        for n in [0usize, 3, 16, 37, 1_003] {
+            let a: Vec<i64> = (0..n as i64).collect();
+            let b: Vec<i64> = (0..n as i64).map(|x| x * 2).collect();
+            let mut c: Vec<i64> = (0..n as i64).map(|x| x * 3).collect();
+            assert!(
+                vec_verify_add_i64(&a, &b, &c),
+                "False mismatch for n = {}",
+                n
+            );
+
+            for i in 0..n {
+                c[i] += 1;
+                assert!(!vec_verify_add_i64(&a, &b, &c), "Missed mismatch at {}", i);
+                c[i] -= 1;
+            }
+        }
+    }
+
+    #[test]
+    fn test_dispatch_matches_cpu() {
+        let features = CpuFeatures::detect();
+        let table = dispatch();
+        let expected = if features.has_avx2 {
+            KernelTier::Avx2
+        } else {
+            KernelTier::Scalar
+        };
+        assert_eq!(table.vec_sum, expected);
+        assert!(table.vec_add >= expected);
+        assert_eq!(table.entries().len(), 7);
+        for ((kernel, tier), (_, max)) in table
+            .entries()
+            .into_iter()
+            .zip(DispatchTable::IMPLEMENTED.entries())
+        {
+            assert!(
+                tier <= max,
+                "{} dispatched above its implementations",
+                kernel
+            );
+        }
+        assert_eq!(active_impl(), table.vec_add.name());
+    }
+
     #[test]
     fn test_vec_scale() {
         let mut arr = vec![1i64, 2, 3, 4, 5];
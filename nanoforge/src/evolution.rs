@@ -212,11 +212,19 @@ impl EvolutionEngine {
     }
 
     /// Evaluate fitness of entire population
+    ///
+    /// Unscored genomes are validated as one batch so the whole generation
+    /// shares a single JIT mapping.
     fn evaluate_population(&mut self) {
-        for genome in &mut self.population {
-            if genome.fitness.is_none() {
-                genome.fitness = self.validator.fitness(genome, &self.test_cases);
-            }
+        let pending: Vec<usize> = (0..self.population.len())
+            .filter(|&i| self.population[i].fitness.is_none())
+            .collect();
+
+        let genomes: Vec<&Genome> = pending.iter().map(|&i| &self.population[i]).collect();
+        let scores = self.validator.fitness_batch(&genomes, &self.test_cases);
+
+        for (idx, fitness) in pending.into_iter().zip(scores) {
+            self.population[idx].fitness = fitness;
         }
     }
 
@@ -29,7 +29,7 @@ use crate::cpu_features::CpuFeatures;
 use crate::parser::Parser;
 use crate::variant_generator::VariantGenerator;
 
-use numpy::{PyArray1, PyReadonlyArray1, PyReadwriteArray1};
+use numpy::{Element, PyArray1, PyReadonlyArray1, PyReadwriteArray1};
 use std::time::Instant;
 
 /// Python-exposed AI Optimizer using Contextual Bandit
@@ -90,6 +90,69 @@ impl Optimizer {
             .update_with_performance(&features, variant_idx, cycles, best_cycles);
     }
 
+    /// Select a variant for each input size in one call
+    ///
+    /// Equivalent to calling `select` per element, minus the per-call FFI
+    /// crossing. Returns the variant indices as an int64 array.
+    pub fn select_batch<'py>(
+        &mut self,
+        py: Python<'py>,
+        input_sizes: PyReadonlyArray1<'py, i64>,
+    ) -> PyResult<Bound<'py, PyArray1<i64>>> {
+        let sizes = input_sizes.as_array();
+        let mut variants = Vec::with_capacity(sizes.len());
+        for &size in sizes.iter() {
+            let features = OptimizationFeatures::new(non_negative("input_sizes", size)?);
+            variants.push(self.bandit.select(&features) as i64);
+        }
+        Ok(PyArray1::from_vec_bound(py, variants))
+    }
+
+    /// Apply `update` to each (input_size, variant, cycles) triple
+    pub fn update_batch<'py>(
+        &mut self,
+        input_sizes: PyReadonlyArray1<'py, i64>,
+        variants: PyReadonlyArray1<'py, i64>,
+        cycles: PyReadonlyArray1<'py, i64>,
+        best_cycles: u64,
+    ) -> PyResult<()> {
+        let (sizes, variants, cycles) = (
+            input_sizes.as_array(),
+            variants.as_array(),
+            cycles.as_array(),
+        );
+        if sizes.len() != variants.len() || sizes.len() != cycles.len() {
+            return Err(PyValueError::new_err(format!(
+                "Array size mismatch: input_sizes={}, variants={}, cycles={}",
+                sizes.len(),
+                variants.len(),
+                cycles.len()
+            )));
+        }
+
+        // Validate the whole batch first so a bad element can't leave it
+        // half-applied
+        let batch = sizes
+            .iter()
+            .zip(variants.iter())
+            .zip(cycles.iter())
+            .map(|((&size, &variant), &cycle)| {
+                Ok((
+                    non_negative("input_sizes", size)?,
+                    non_negative("variants", variant)? as usize,
+                    non_negative("cycles", cycle)?,
+                ))
+            })
+            .collect::<PyResult<Vec<_>>>()?;
+
+        for (size, variant, cycle) in batch {
+            let features = OptimizationFeatures::new(size);
+            self.bandit
+                .update_with_performance(&features, variant, cycle, best_cycles);
+        }
+        Ok(())
+    }
+
     /// Save optimizer state to file
     pub fn save(&self, path: &str) -> PyResult<()> {
         self.bandit
@@ -117,9 +180,18 @@ impl Optimizer {
     }
 }
 
+/// Convert a batch element to u64, rejecting negatives
+fn non_negative(name: &str, value: i64) -> PyResult<u64> {
+    u64::try_from(value)
+        .map_err(|_| PyValueError::new_err(format!("{} must be non-negative, got {}", name, value)))
+}
+
 /// Python-exposed compiled function
 /// Stores the full CompiledVariant to keep the JIT memory alive
-#[pyclass]
+///
+/// `frozen`: every method takes `&self`, so calls skip PyO3's runtime
+/// borrow-flag bookkeeping and go straight to the JIT'd function pointer.
+#[pyclass(frozen)]
 pub struct CompiledFunction {
     // Keep the variant alive to prevent the JIT memory from being freed
     #[allow(dead_code)]
@@ -151,20 +223,46 @@ pub fn cpu_features() -> String {
 }
 
 /// Get detailed CPU feature detection
+///
+/// Besides the feature flags, the `"dispatch"` entry maps each array kernel
+/// to the implementation tier it actually runs on this CPU
+/// (`"avx512"`, `"avx2"` or `"scalar"`), and `"dispatch_max"` to the
+/// highest tier that kernel has an implementation for.
 #[pyfunction]
-pub fn cpu_info() -> std::collections::HashMap<String, bool> {
+pub fn cpu_info(py: Python<'_>) -> std::collections::HashMap<String, PyObject> {
     let features = CpuFeatures::detect();
     let mut map = std::collections::HashMap::new();
-    map.insert("sse2".to_string(), features.has_sse2);
-    map.insert("sse4_1".to_string(), features.has_sse4_1);
-    map.insert("sse4_2".to_string(), features.has_sse4_2);
-    map.insert("avx".to_string(), features.has_avx);
-    map.insert("avx2".to_string(), features.has_avx2);
-    map.insert("avx512f".to_string(), features.has_avx512f);
-    map.insert("amx_tile".to_string(), features.has_amx_tile);
+    map.insert("sse2".to_string(), features.has_sse2.into_py(py));
+    map.insert("sse4_1".to_string(), features.has_sse4_1.into_py(py));
+    map.insert("sse4_2".to_string(), features.has_sse4_2.into_py(py));
+    map.insert("avx".to_string(), features.has_avx.into_py(py));
+    map.insert("avx2".to_string(), features.has_avx2.into_py(py));
+    map.insert("avx512f".to_string(), features.has_avx512f.into_py(py));
+    map.insert("amx_tile".to_string(), features.has_amx_tile.into_py(py));
+
+    let dispatch: std::collections::HashMap<String, String> = array_ops::dispatch()
+        .entries()
+        .into_iter()
+        .map(|(kernel, tier)| (kernel.to_string(), tier.name().to_string()))
+        .collect();
+    map.insert("dispatch".to_string(), dispatch.into_py(py));
+
+    let dispatch_max: std::collections::HashMap<String, String> =
+        array_ops::DispatchTable::IMPLEMENTED
+            .entries()
+            .into_iter()
+            .map(|(kernel, tier)| (kernel.to_string(), tier.name().to_string()))
+            .collect();
+    map.insert("dispatch_max".to_string(), dispatch_max.into_py(py));
     map
 }
 
+/// Which vec_add implementation runs on this CPU ("scalar", "avx2", "avx512")
+#[pyfunction]
+pub fn active_impl() -> &'static str {
+    array_ops::active_impl()
+}
+
 /// Compile a NanoForge script
 #[pyfunction]
 pub fn compile(source: &str) -> PyResult<CompiledFunction> {
@@ -190,8 +288,47 @@ pub fn compile(source: &str) -> PyResult<CompiledFunction> {
 
 // ============================================================================
 // NumPy Array Operations (Zero-Copy, AVX2 Accelerated)
+//
+// Kernels run with the GIL released (`py.allow_threads`), so callers can
+// split work across Python threads. Outputs are taken as
+// `PyReadwriteArray1`: numpy's borrow checker rejects an output that
+// overlaps an input or another thread's in-flight output before the GIL
+// is dropped, so no two kernels ever write the same memory concurrently.
 // ============================================================================
 
+/// Borrow a read-only array as a slice, naming it in the contiguity error
+fn contiguous<'a, T: Element>(arr: &'a PyReadonlyArray1<'_, T>, name: &str) -> PyResult<&'a [T]> {
+    arr.as_slice()
+        .map_err(|e| PyValueError::new_err(format!("Array {} not contiguous: {}", name, e)))
+}
+
+/// Reject operands of an elementwise kernel whose lengths differ
+fn check_lengths(a: usize, b: usize, c: usize) -> PyResult<()> {
+    if a != b || a != c {
+        return Err(PyValueError::new_err(format!(
+            "Array size mismatch: a={}, b={}, c={}",
+            a, b, c
+        )));
+    }
+    Ok(())
+}
+
+/// Borrow the operands of `c = a op b` as slices, checking contiguity and
+/// lengths before the GIL is released
+fn binary_op_slices<'a, T: Element>(
+    a: &'a PyReadonlyArray1<'_, T>,
+    b: &'a PyReadonlyArray1<'_, T>,
+    c: &'a mut PyReadwriteArray1<'_, T>,
+) -> PyResult<(&'a [T], &'a [T], &'a mut [T])> {
+    let a_slice = contiguous(a, "a")?;
+    let b_slice = contiguous(b, "b")?;
+    let c_slice = c
+        .as_slice_mut()
+        .map_err(|e| PyValueError::new_err(format!("Array c not contiguous: {}", e)))?;
+    check_lengths(a_slice.len(), b_slice.len(), c_slice.len())?;
+    Ok((a_slice, b_slice, c_slice))
+}
+
 /// Add two arrays: C = A + B (AVX2 accelerated)
 ///
 /// Example:
@@ -206,31 +343,42 @@ pub fn compile(source: &str) -> PyResult<CompiledFunction> {
 /// ```
 #[pyfunction]
 pub fn vec_add<'py>(
+    py: Python<'py>,
     a: PyReadonlyArray1<'py, i64>,
     b: PyReadonlyArray1<'py, i64>,
-    c: &PyArray1<i64>,
+    mut c: PyReadwriteArray1<'py, i64>,
 ) -> PyResult<()> {
-    let a_slice = a
-        .as_slice()
-        .map_err(|e| PyValueError::new_err(format!("Array a not contiguous: {}", e)))?;
-    let b_slice = b
-        .as_slice()
-        .map_err(|e| PyValueError::new_err(format!("Array b not contiguous: {}", e)))?;
-
-    // Get mutable slice from c
-    let c_slice = unsafe { c.as_slice_mut() }
-        .map_err(|e| PyValueError::new_err(format!("Array c not contiguous: {}", e)))?;
+    let (a_slice, b_slice, c_slice) = binary_op_slices(&a, &b, &mut c)?;
+    py.allow_threads(|| array_ops::vec_add_i64(a_slice, b_slice, c_slice));
+    Ok(())
+}
 
-    if a_slice.len() != b_slice.len() || a_slice.len() != c_slice.len() {
-        return Err(PyValueError::new_err(format!(
-            "Array size mismatch: a={}, b={}, c={}",
-            a_slice.len(),
-            b_slice.len(),
-            c_slice.len()
-        )));
-    }
+/// Add two int32 arrays: C = A + B (AVX2 accelerated, wrapping)
+///
+/// Moves half the bytes per element of `vec_add`, so memory-bound
+/// sizes see roughly double the throughput.
+#[pyfunction]
+pub fn vec_add_i32<'py>(
+    py: Python<'py>,
+    a: PyReadonlyArray1<'py, i32>,
+    b: PyReadonlyArray1<'py, i32>,
+    mut c: PyReadwriteArray1<'py, i32>,
+) -> PyResult<()> {
+    let (a_slice, b_slice, c_slice) = binary_op_slices(&a, &b, &mut c)?;
+    py.allow_threads(|| array_ops::vec_add_i32(a_slice, b_slice, c_slice));
+    Ok(())
+}
 
-    array_ops::vec_add_i64(a_slice, b_slice, c_slice);
+/// Add two float32 arrays: C = A + B (AVX2 accelerated)
+#[pyfunction]
+pub fn vec_add_f32<'py>(
+    py: Python<'py>,
+    a: PyReadonlyArray1<'py, f32>,
+    b: PyReadonlyArray1<'py, f32>,
+    mut c: PyReadwriteArray1<'py, f32>,
+) -> PyResult<()> {
+    let (a_slice, b_slice, c_slice) = binary_op_slices(&a, &b, &mut c)?;
+    py.allow_threads(|| array_ops::vec_add_f32(a_slice, b_slice, c_slice));
     Ok(())
 }
 
@@ -244,23 +392,56 @@ pub fn vec_add<'py>(
 /// total = nanoforge.vec_sum(arr)
 /// ```
 #[pyfunction]
-pub fn vec_sum(arr: PyReadonlyArray1<i64>) -> PyResult<i64> {
+pub fn vec_sum(py: Python<'_>, arr: PyReadonlyArray1<i64>) -> PyResult<i64> {
+    let slice = arr
+        .as_slice()
+        .map_err(|e| PyValueError::new_err(format!("Array not contiguous: {}", e)))?;
+    Ok(py.allow_threads(|| array_ops::vec_sum_i64(slice)))
+}
+
+/// Sum all elements of an int32 array, returning an exact int64 total
+///
+/// Uses 8 x i32 AVX2 lanes with periodic widening, twice the lanes of
+/// the int64 `vec_sum` path.
+#[pyfunction]
+pub fn vec_sum_i32(py: Python<'_>, arr: PyReadonlyArray1<i32>) -> PyResult<i64> {
     let slice = arr
         .as_slice()
         .map_err(|e| PyValueError::new_err(format!("Array not contiguous: {}", e)))?;
-    Ok(array_ops::vec_sum_i64(slice))
+    Ok(py.allow_threads(|| array_ops::vec_sum_i32(slice)))
 }
 
 /// Scale array in-place: arr *= scalar
 #[pyfunction]
-pub fn vec_scale(mut arr: PyReadwriteArray1<i64>, scalar: i64) -> PyResult<()> {
+pub fn vec_scale(py: Python<'_>, mut arr: PyReadwriteArray1<i64>, scalar: i64) -> PyResult<()> {
     let slice = arr
         .as_slice_mut()
         .map_err(|e| PyValueError::new_err(format!("Array not contiguous: {}", e)))?;
-    array_ops::vec_scale_i64(slice, scalar);
+    py.allow_threads(|| array_ops::vec_scale_i64(slice, scalar));
     Ok(())
 }
 
+/// Check that C == A + B in one fused pass (no temporary `a + b` array)
+///
+/// Example:
+/// ```python
+/// nanoforge.vec_add(a, b, c)
+/// assert nanoforge.vec_verify_add(a, b, c)
+/// ```
+#[pyfunction]
+pub fn vec_verify_add<'py>(
+    py: Python<'py>,
+    a: PyReadonlyArray1<'py, i64>,
+    b: PyReadonlyArray1<'py, i64>,
+    c: PyReadonlyArray1<'py, i64>,
+) -> PyResult<bool> {
+    let a_slice = contiguous(&a, "a")?;
+    let b_slice = contiguous(&b, "b")?;
+    let c_slice = contiguous(&c, "c")?;
+    check_lengths(a_slice.len(), b_slice.len(), c_slice.len())?;
+    Ok(py.allow_threads(|| array_ops::vec_verify_add_i64(a_slice, b_slice, c_slice)))
+}
+
 /// Benchmark vec_add: returns (nanoforge_ns, numpy_estimated_ns)
 /// This runs NanoForge vec_add and estimates NumPy time based on memory bandwidth
 #[pyfunction]
@@ -399,16 +580,25 @@ pub fn evolve(script: String, generations: u32, population: usize) -> PyResult<(
 /// Python module definition
 #[pymodule]
 fn nanoforge(_py: Python, m: &PyModule) -> PyResult<()> {
+    // Resolve kernel dispatch at import (the ifunc-resolver moment), so the
+    // first timed call doesn't pay for CPUID and OS XSAVE checks
+    array_ops::dispatch();
+
     m.add_class::<Optimizer>()?;
     m.add_class::<CompiledFunction>()?;
     m.add_function(wrap_pyfunction!(cpu_features, m)?)?;
     m.add_function(wrap_pyfunction!(cpu_info, m)?)?;
+    m.add_function(wrap_pyfunction!(active_impl, m)?)?;
     m.add_function(wrap_pyfunction!(compile, m)?)?;
     m.add_function(wrap_pyfunction!(version, m)?)?;
     // NumPy array operations
     m.add_function(wrap_pyfunction!(vec_add, m)?)?;
+    m.add_function(wrap_pyfunction!(vec_add_i32, m)?)?;
+    m.add_function(wrap_pyfunction!(vec_add_f32, m)?)?;
     m.add_function(wrap_pyfunction!(vec_sum, m)?)?;
+    m.add_function(wrap_pyfunction!(vec_sum_i32, m)?)?;
     m.add_function(wrap_pyfunction!(vec_scale, m)?)?;
+    m.add_function(wrap_pyfunction!(vec_verify_add, m)?)?;
     m.add_function(wrap_pyfunction!(benchmark_vec_add, m)?)?;
     // Evolution
     m.add_function(wrap_pyfunction!(evolve, m)?)?;
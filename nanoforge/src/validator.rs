@@ -9,6 +9,9 @@ use crate::jit_memory::DualMappedMemory;
 use crate::mutator::Genome;
 use std::time::{Duration, Instant};
 
+/// Alignment of each candidate's code within a batched JIT mapping
+const CODE_ALIGN: usize = 16;
+
 /// Result of validation
 #[derive(Debug, Clone, PartialEq)]
 pub enum ValidationResult {
@@ -78,27 +81,9 @@ impl Validator {
 
     /// Validate a genome against test cases
     pub fn validate(&self, genome: &Genome, test_cases: &[TestCase]) -> ValidationResult {
-        // Convert genome to function
-        let func = genome.to_function();
-
-        // Create program with single function
-        let mut program = Program::new();
-        program.add_function(func);
-
-        // Compile to machine code - wrapped in catch_unwind because
-        // mutated genomes might cause panics in the assembler (e.g., missing labels)
-        let compile_result = std::panic::catch_unwind(std::panic::AssertUnwindSafe(|| {
-            Compiler::compile_program(&program, 0)
-        }));
-
-        let (code, _) = match compile_result {
-            Ok(Ok(result)) => result,
-            Ok(Err(e)) => return ValidationResult::CompileError(e),
-            Err(_) => {
-                return ValidationResult::CompileError(
-                    "Compilation panicked (invalid genome)".to_string(),
-                )
-            }
+        let code = match Self::compile_genome(genome) {
+            Ok(code) => code,
+            Err(result) => return result,
         };
 
         // Allocate executable memory
@@ -118,7 +103,103 @@ impl Validator {
         // Create function pointer
         let func_ptr: extern "C" fn(i64) -> i64 = unsafe { std::mem::transmute(memory.rx_ptr) };
 
-        // Run test cases
+        self.run_test_cases(func_ptr, test_cases)
+    }
+
+    /// Validate a whole batch of genomes against the same test cases
+    ///
+    /// Every candidate is compiled up front and packed into a single
+    /// executable mapping, so a generation pays for one memfd/mmap pair
+    /// instead of one per genome. Results are returned in input order.
+    pub fn validate_batch(
+        &self,
+        genomes: &[&Genome],
+        test_cases: &[TestCase],
+    ) -> Vec<ValidationResult> {
+        let compiled: Vec<Result<Vec<u8>, ValidationResult>> =
+            genomes.iter().map(|g| Self::compile_genome(g)).collect();
+
+        // Lay out each candidate at a 16-byte aligned offset
+        let mut offsets = Vec::with_capacity(compiled.len());
+        let mut total_len = 0;
+        for code in &compiled {
+            offsets.push(total_len);
+            if let Ok(code) = code {
+                total_len += (code.len() + CODE_ALIGN - 1) & !(CODE_ALIGN - 1);
+            }
+        }
+
+        let memory = match DualMappedMemory::new(total_len.max(4096)) {
+            Ok(m) => m,
+            Err(e) => {
+                let error = format!("Memory allocation failed: {}", e);
+                return compiled
+                    .into_iter()
+                    .map(|code| match code {
+                        Ok(_) => ValidationResult::CompileError(error.clone()),
+                        Err(result) => result,
+                    })
+                    .collect();
+            }
+        };
+
+        for (code, &offset) in compiled.iter().zip(&offsets) {
+            if let Ok(code) = code {
+                unsafe {
+                    std::ptr::copy_nonoverlapping(
+                        code.as_ptr(),
+                        memory.rw_ptr.add(offset),
+                        code.len(),
+                    );
+                }
+            }
+        }
+        memory.flush_icache();
+
+        compiled
+            .into_iter()
+            .zip(offsets)
+            .map(|(code, offset)| match code {
+                Ok(_) => {
+                    let func_ptr: extern "C" fn(i64) -> i64 =
+                        unsafe { std::mem::transmute(memory.rx_ptr.add(offset)) };
+                    self.run_test_cases(func_ptr, test_cases)
+                }
+                Err(result) => result,
+            })
+            .collect()
+    }
+
+    /// Compile a genome to machine code
+    fn compile_genome(genome: &Genome) -> Result<Vec<u8>, ValidationResult> {
+        // Convert genome to function
+        let func = genome.to_function();
+
+        // Create program with single function
+        let mut program = Program::new();
+        program.add_function(func);
+
+        // Compile to machine code - wrapped in catch_unwind because
+        // mutated genomes might cause panics in the assembler (e.g., missing labels)
+        let compile_result = std::panic::catch_unwind(std::panic::AssertUnwindSafe(|| {
+            Compiler::compile_program(&program, 0)
+        }));
+
+        match compile_result {
+            Ok(Ok((code, _))) => Ok(code),
+            Ok(Err(e)) => Err(ValidationResult::CompileError(e)),
+            Err(_) => Err(ValidationResult::CompileError(
+                "Compilation panicked (invalid genome)".to_string(),
+            )),
+        }
+    }
+
+    /// Run all test cases against an already-loaded function
+    fn run_test_cases(
+        &self,
+        func_ptr: extern "C" fn(i64) -> i64,
+        test_cases: &[TestCase],
+    ) -> ValidationResult {
         let mut total_time_ns: u64 = 0;
         let mut test_count = 0;
 
@@ -201,6 +282,19 @@ impl Validator {
             _ => None, // Invalid genomes have no fitness
         }
     }
+
+    /// Batched version of `fitness`, sharing one JIT mapping across genomes
+    pub fn fitness_batch(&self, genomes: &[&Genome], test_cases: &[TestCase]) -> Vec<Option<f64>> {
+        self.validate_batch(genomes, test_cases)
+            .into_iter()
+            .map(|result| match result {
+                ValidationResult::Valid {
+                    execution_time_ns, ..
+                } => Some(execution_time_ns as f64),
+                _ => None,
+            })
+            .collect()
+    }
 }
 
 /// Result of a single execution attempt
@@ -266,6 +360,69 @@ mod tests {
         assert!(!wrong.is_valid());
     }
 
+    #[test]
+    fn test_validate_batch_matches_single() {
+        let validator = Validator::default();
+        let genome = create_simple_genome();
+        let test_cases = vec![TestCase::new(10, 11), TestCase::new(41, 42)];
+
+        let single = validator.validate(&genome, &test_cases);
+        let batch = validator.validate_batch(&[&genome, &genome, &genome], &test_cases);
+
+        assert!(single.is_valid());
+        assert_eq!(batch.len(), 3);
+        assert!(batch.iter().all(|r| r.is_valid()));
+    }
+
+    #[test]
+    fn test_validate_batch_mixed_keeps_order() {
+        let validator = Validator::default();
+        let test_cases = vec![TestCase::new(10, 11), TestCase::new(41, 42)];
+
+        let valid = create_simple_genome();
+
+        // Returns input + 2
+        let mut wrong = create_simple_genome();
+        wrong.instructions[1].src1 = Some(Operand::Imm(2));
+
+        // Jumps to a label that is never defined, so assembly fails and
+        // the genome takes up no space in the batch mapping
+        let mut broken = create_simple_genome();
+        broken.instructions.insert(
+            2,
+            Instruction {
+                op: Opcode::Jmp,
+                dest: Some(Operand::Label("nowhere".to_string())),
+                src1: None,
+                src2: None,
+            },
+        );
+
+        let genomes = [&valid, &broken, &valid, &wrong, &valid];
+        let batch = validator.validate_batch(&genomes, &test_cases);
+
+        assert_eq!(batch.len(), genomes.len());
+        for (i, (result, genome)) in batch.iter().zip(genomes).enumerate() {
+            let single = validator.validate(genome, &test_cases);
+            match (result, &single) {
+                // Timings differ from run to run; only the output must match
+                (
+                    ValidationResult::Valid { output: a, .. },
+                    ValidationResult::Valid { output: b, .. },
+                ) => assert_eq!(a, b, "Output differs at index {}", i),
+                _ => assert_eq!(result, &single, "Result differs at index {}", i),
+            }
+        }
+        assert!(matches!(batch[1], ValidationResult::CompileError(_)));
+        assert_eq!(
+            batch[3],
+            ValidationResult::WrongOutput {
+                expected: 11,
+                actual: 12
+            }
+        );
+    }
+
     #[test]
     fn test_test_case() {
         let tc = TestCase::new(10, 11);